@@ -1,10 +1,14 @@
 """Configuration management for ENTSO-E API Python client."""
 
+import atexit
 import os
+import random
 import sys
+import threading
 from typing import Callable, Literal, Optional, Union, get_args
 from uuid import UUID
 
+from httpx import Client
 from loguru._logger import Core as _Core, Logger as _Logger
 
 LogLevel = Literal["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
@@ -19,6 +23,12 @@ LogFormat = (
     "<level>{message}</level>"
 )
 
+# Upper bound in seconds for the default retry delay
+MAX_RETRY_DELAY = 60
+
+# Random source of the retry jitter; can be seeded to make delays reproducible
+retry_random = random.Random()
+
 # Create an independent Loguru logger instance for this package
 logger = _Logger(
     core=_Core(),
@@ -71,6 +81,24 @@ def set_log_level(level: LogLevel) -> None:
     )
 
 
+def exponential_backoff(attempt: int) -> float:
+    """
+    Default retry delay: exponential backoff with jitter.
+
+    Waits a random time between zero and 2**attempt seconds (full jitter),
+    capped at MAX_RETRY_DELAY, so that parallel requests failing at the same
+    time do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based number of the failed attempt
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(2**attempt, MAX_RETRY_DELAY)
+    return retry_random.uniform(0, delay)
+
+
 class EntsoEConfig:
     """
     Configuration class for ENTSO-E API Python client.
@@ -82,6 +110,7 @@ class EntsoEConfig:
     - Number of retries for failed requests
     - Delay between retry attempts
     - Log level for loguru logger
+    - Optional on-disk cache for query results
     """
 
     def __init__(
@@ -90,9 +119,16 @@ class EntsoEConfig:
         endpoint_url: Optional[str] = None,
         timeout: int = 5,
         retries: int = 5,
-        retry_delay: Union[int, Callable[[int], int]] = lambda attempt: 2**attempt,
+        retry_delay: Union[int, Callable[[int], float]] = exponential_backoff,
         max_workers: int = 4,
+        max_offset: int = 4800,
+        pagination_concurrency: int = 1,
         log_level: LogLevel = "SUCCESS",
+        cache_dir: Optional[str] = None,
+        cache_ttl: Optional[int] = None,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_reset: float = 30,
+        http_client: Optional[Client] = None,
     ):
         """
         Initialize configuration with global options.
@@ -107,11 +143,30 @@ class EntsoEConfig:
             timeout: Request timeout in seconds (default: 5)
             retries: Number of retry attempts for failed requests (default: 5)
             retry_delay: Function that takes attempt number and returns delay in seconds,
-                        or integer for constant delay (default: exponential backoff 2**attempt)
-            max_workers: Maximum number of parallel API calls when splitting large date
-                        ranges (default: 4)
+                        or integer for constant delay (default: exponential backoff with jitter,
+                        see exponential_backoff)
+            max_workers: Maximum number of concurrent API requests across date range
+                        splitting and pagination, and number of parallel calls when
+                        splitting large date ranges (default: 4)
+            max_offset: Highest offset requested when paginating through large
+                       result sets (default: 4800, the ENTSO-E API limit)
+            pagination_concurrency: Number of pages requested ahead in parallel when
+                                   paginating through large result sets (default: 1)
             log_level: Log level for loguru logger. Available levels: TRACE, DEBUG,
                       INFO, SUCCESS, WARNING, ERROR, CRITICAL (default: SUCCESS)
+            cache_dir: Directory for caching query results on disk. Requires the
+                      optional diskcache package. Caching is disabled if not provided.
+            cache_ttl: Time in seconds after which cached results expire
+                      (default: None, cached results never expire)
+            circuit_breaker_threshold: Number of consecutive failed requests after
+                                      which requests fail fast with CircuitOpenError
+                                      instead of being retried (default: None, the
+                                      circuit breaker is disabled)
+            circuit_breaker_reset: Seconds after which a failing-fast circuit lets
+                                  a probe request through (default: 30)
+            http_client: httpx.Client used for all requests, e.g. to configure
+                        proxies or connection limits (default: None, a shared
+                        client created by the package)
 
         Raises:
             ValueError: If security_token is not provided and ENTSOE_API environment
@@ -165,7 +220,56 @@ class EntsoEConfig:
             # It's already a callable function (including the default)
             self.retry_delay = retry_delay
         self.max_workers = max_workers
+        self.max_offset = max_offset
+        self.pagination_concurrency = pagination_concurrency
         self.log_level = log_level
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_reset = circuit_breaker_reset
+        self.http_client = http_client
+        self._cache = None
+        self._cache_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """
+        Get the on-disk cache for query results.
+
+        The cache is opened on first access, once even if several threads access
+        it at the same time.
+
+        Returns:
+            diskcache.Cache instance, or None if caching is disabled
+
+        Raises:
+            ImportError: If cache_dir is set but diskcache is not installed
+        """
+        if self.cache_dir is None:
+            return None
+
+        with self._cache_lock:
+            if self._cache is None:
+                try:
+                    from diskcache import Cache
+                except ImportError as e:
+                    raise ImportError(
+                        "Caching query results requires the diskcache package. "
+                        "Install it using pip install entsoe-apy[cache]."
+                    ) from e
+
+                self._cache = Cache(self.cache_dir)
+                logger.debug("Opened result cache at {}", self.cache_dir)
+
+            return self._cache
+
+    def close_cache(self) -> None:
+        """Close the on-disk cache and its database connections if it was opened."""
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+                logger.debug("Closed result cache at {}", self.cache_dir)
 
     def validate_security_token(self) -> None:
         """
@@ -201,6 +305,13 @@ class EntsoEConfig:
 _global_config: Optional[EntsoEConfig] = None
 
 
+@atexit.register
+def _close_global_cache():
+    """Close the result cache of the global configuration at interpreter exit."""
+    if _global_config is not None:
+        _global_config.close_cache()
+
+
 def get_config() -> EntsoEConfig:
     """
     Get the global configuration instance.
@@ -225,9 +336,16 @@ def set_config(
     endpoint_url: Optional[str] = None,
     timeout: int = 5,
     retries: int = 5,
-    retry_delay: Union[int, Callable[[int], int]] = lambda attempt: 2**attempt,
+    retry_delay: Union[int, Callable[[int], float]] = exponential_backoff,
     max_workers: int = 4,
+    max_offset: int = 4800,
+    pagination_concurrency: int = 1,
     log_level: LogLevel = "SUCCESS",
+    cache_dir: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
+    circuit_breaker_threshold: Optional[int] = None,
+    circuit_breaker_reset: float = 30,
+    http_client: Optional[Client] = None,
 ) -> None:
     """
     Set the global configuration.
@@ -241,13 +359,35 @@ def set_config(
         timeout: Request timeout in seconds (default: 5)
         retries: Number of retry attempts for failed requests (default: 5)
         retry_delay: Function that takes attempt number and returns delay in seconds,
-                    or integer for constant delay (default: exponential backoff 2**attempt)
-        max_workers: Maximum number of parallel API calls when splitting large date
-                    ranges (default: 4)
+                    or integer for constant delay (default: exponential backoff with jitter,
+                    see exponential_backoff)
+        max_workers: Maximum number of concurrent API requests across date range
+                    splitting and pagination, and number of parallel calls when
+                    splitting large date ranges (default: 4)
+        max_offset: Highest offset requested when paginating through large
+                   result sets (default: 4800, the ENTSO-E API limit)
+        pagination_concurrency: Number of pages requested ahead in parallel when
+                               paginating through large result sets (default: 1)
         log_level: Log level for loguru logger. Available levels: TRACE, DEBUG,
                   INFO, SUCCESS, WARNING, ERROR, CRITICAL (default: SUCCESS)
+        cache_dir: Directory for caching query results on disk. Requires the
+                  optional diskcache package. Caching is disabled if not provided.
+        cache_ttl: Time in seconds after which cached results expire
+                  (default: None, cached results never expire)
+        circuit_breaker_threshold: Number of consecutive failed requests after
+                                  which requests fail fast with CircuitOpenError
+                                  instead of being retried (default: None, the
+                                  circuit breaker is disabled)
+        circuit_breaker_reset: Seconds after which a failing-fast circuit lets
+                              a probe request through (default: 30)
+        http_client: httpx.Client used for all requests, e.g. to configure
+                    proxies or connection limits (default: None, a shared
+                    client created by the package)
     """
     global _global_config
+    if _global_config is not None:
+        # Release the database connections of the replaced configuration's cache
+        _global_config.close_cache()
     _global_config = EntsoEConfig(
         security_token=security_token,
         endpoint_url=endpoint_url,
@@ -255,5 +395,12 @@ def set_config(
         retries=retries,
         retry_delay=retry_delay,
         max_workers=max_workers,
+        max_offset=max_offset,
+        pagination_concurrency=pagination_concurrency,
         log_level=log_level,
+        cache_dir=cache_dir,
+        cache_ttl=cache_ttl,
+        circuit_breaker_threshold=circuit_breaker_threshold,
+        circuit_breaker_reset=circuit_breaker_reset,
+        http_client=http_client,
     )
@@ -1,19 +1,43 @@
-from concurrent.futures import ThreadPoolExecutor
-from contextvars import ContextVar
+import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
+import hashlib
 import io
-from itertools import chain
-from time import sleep
+from itertools import chain, islice
+import json
+import threading
+from time import monotonic, sleep
+from weakref import WeakKeyDictionary
 import zipfile
 
-from httpx import RequestError, Response
+from httpx import RequestError, Response, TransportError
 from pydantic import BaseModel
 
-from ..config.config import get_config, logger
+from ..config.config import MAX_RETRY_DELAY, get_config, logger
 from ..utils.utils import (
     check_date_range_limit,
+    format_entsoe_datetime,
     split_date_range as split_date_range_util,
 )
+from ..xml_models import (
+    AcknowledgementMarketDocument,
+    V7AcknowledgementMarketDocument,
+    V8AcknowledgementMarketDocument,
+)
+
+# All generated versions of the acknowledgement document
+ACKNOWLEDGEMENT_DOCUMENTS = (
+    AcknowledgementMarketDocument,
+    V7AcknowledgementMarketDocument,
+    V8AcknowledgementMarketDocument,
+)
+
+# Local file header signature at the start of every ZIP archive
+ZIP_SIGNATURE = b"PK\x03\x04"
 
 max_days_limit_ctx: ContextVar[int] = ContextVar("max_days_limit")
 offset_increment_ctx: ContextVar[int] = ContextVar("offset_increment")
@@ -26,9 +50,18 @@ class AcknowledgementDocumentError(Exception):
 
 
 class ServiceUnavailableError(Exception):
-    """Raised when the ENTSO-E API returns a 503 Service Unavailable status."""
+    """
+    Raised when the ENTSO-E API returns a 503 Service Unavailable or 429 Too Many
+    Requests status.
 
-    pass
+    Attributes:
+        retry_after: Seconds to wait before the next request as requested by the
+                     Retry-After header, or None if the response had none.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class UnexpectedError(Exception):
@@ -37,14 +70,21 @@ class UnexpectedError(Exception):
     pass
 
 
+class CircuitOpenError(Exception):
+    """Raised without a request while the API is failing persistently."""
+
+    pass
+
+
 class ContextPropagatingThreadPoolExecutor(ThreadPoolExecutor):
     """
     ThreadPoolExecutor that propagates context variables to worker threads.
 
     This custom executor extends ThreadPoolExecutor to ensure that context variables
-    are properly propagated from the main thread to worker threads. Specifically, it
-    captures the offset_increment_ctx value when a task is submitted and restores it
-    in the worker thread before task execution.
+    are properly propagated from the main thread to worker threads. When a task is
+    submitted, it captures a copy of the current context and runs the task within
+    that copy, so every task sees the caller's context variables while changes made
+    by one task stay local to it.
 
     This is necessary because Python's contextvars are not automatically inherited by
     threads created via ThreadPoolExecutor, but pagination logic requires access to
@@ -56,99 +96,244 @@ class ContextPropagatingThreadPoolExecutor(ThreadPoolExecutor):
             results = [future.result() for future in futures]
     """
 
-    @staticmethod
-    def _context_propagation_wrapper(fn, offset_increment, *args, **kwargs):
-        """
-        Wrapper method that propagates context variables to worker threads.
-
-        This method is used internally to ensure that context variables
-        (specifically offset_increment_ctx) are properly set in worker threads
-        before executing the target function. Python's contextvars are not
-        automatically inherited by threads, so this wrapper explicitly restores
-        the context before function execution.
-
-        Args:
-            fn: The function to execute in the worker thread
-            offset_increment: The offset increment value to propagate to the worker thread
-            *args: Positional arguments to pass to the function
-            **kwargs: Keyword arguments to pass to the function
-
-        Returns:
-            The return value of the executed function
-        """
-        offset_increment_ctx.set(offset_increment)
-        return fn(*args, **kwargs)
-
     def submit(self, fn, *args, **kwargs):
-        offset_increment = offset_increment_ctx.get()
-        return super().submit(
-            self._context_propagation_wrapper, fn, offset_increment, *args, **kwargs
-        )
+        # Run the task in a snapshot of the caller's context. This carries every
+        # context variable the caller has set (not only offset_increment_ctx), does
+        # not require any of them to be set, and keeps changes made by the task out
+        # of the caller's context and other tasks.
+        return super().submit(copy_context().run, fn, *args, **kwargs)
+
+
+# Persistent executor for split_date_range, sized to the configured max_workers
+_split_pool: ContextPropagatingThreadPoolExecutor | None = None
+_split_pool_workers = 0
+_split_pool_lock = threading.Lock()
+
+
+def _get_split_pool(max_workers: int) -> ContextPropagatingThreadPoolExecutor:
+    """
+    Return the shared split_date_range executor with max_workers threads.
+
+    The executor is created on first use and replaced, shutting the previous one
+    down, when max_workers changes. Chunks already submitted to the previous
+    executor still run to completion.
+    """
+    global _split_pool, _split_pool_workers
+    with _split_pool_lock:
+        if _split_pool is None or _split_pool_workers != max_workers:
+            if _split_pool is not None:
+                _split_pool.shutdown(wait=False)
+            logger.debug(
+                "Creating split_date_range thread pool with {} workers", max_workers
+            )
+            _split_pool = ContextPropagatingThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="Thread"
+            )
+            _split_pool_workers = max_workers
+        return _split_pool
+
+
+@atexit.register
+def _shutdown_split_pool():
+    """Shut down the split_date_range executor at interpreter exit."""
+    global _split_pool
+    with _split_pool_lock:
+        if _split_pool is not None:
+            _split_pool.shutdown(wait=False, cancel_futures=True)
+            _split_pool = None
+
+
+# Semaphore bounding concurrent HTTP requests, sized to the configured max_workers
+_request_semaphore: threading.BoundedSemaphore | None = None
+_request_semaphore_size = 0
+_request_semaphore_lock = threading.Lock()
+
+
+def _get_request_semaphore(max_requests: int) -> threading.BoundedSemaphore:
+    """
+    Return the shared semaphore allowing max_requests concurrent requests.
+
+    The semaphore is replaced when max_requests changes; requests holding the
+    previous one release it when they finish.
+    """
+    global _request_semaphore, _request_semaphore_size
+    with _request_semaphore_lock:
+        if _request_semaphore is None or _request_semaphore_size != max_requests:
+            _request_semaphore = threading.BoundedSemaphore(max_requests)
+            _request_semaphore_size = max_requests
+        return _request_semaphore
+
+
+class _CircuitBreaker:
+    """
+    Circuit breaker shared by all requests made with one configuration.
+
+    Counts consecutive transient failures. Once circuit_breaker_threshold is
+    reached the circuit opens and requests fail fast for circuit_breaker_reset
+    seconds. After that a single probe request is let through (half-open): a
+    success closes the circuit, a failure opens it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def allow(self, reset_timeout: float) -> bool:
+        """Return whether a request may be made now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or monotonic() - self._opened_at < reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a request the API answered."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self, threshold: int) -> bool:
+        """Count a transient failure and return whether the circuit is open."""
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._failures >= threshold:
+                self._opened_at = monotonic()
+            return self._opened_at is not None
+
+    def release_probe(self) -> None:
+        """Let another probe through after one that got no answer from the API."""
+        with self._lock:
+            self._probing = False
+
+
+# Circuit breakers by configuration, so set_config starts from a closed circuit
+_circuit_breakers: WeakKeyDictionary = WeakKeyDictionary()
+_circuit_breakers_lock = threading.Lock()
+
+
+def _get_circuit_breaker(config) -> _CircuitBreaker:
+    """Return the circuit breaker of the given configuration."""
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(config)
+        if breaker is None:
+            breaker = _CircuitBreaker()
+            _circuit_breakers[config] = breaker
+        return breaker
+
+
+def limit_concurrent_requests(func):
+    """
+    Decorator that bounds the number of concurrent requests to the ENTSO-E API.
+
+    split_date_range and pagination run their calls on separate thread pools, and
+    pagination runs inside the split workers, so their thread counts multiply.
+    This decorator wraps the HTTP request itself and lets at most max_workers
+    (configuration setting, default: 4) requests run at the same time across all
+    threads; further requests wait for a free slot. Only the request is guarded,
+    so waiting threads never hold a slot another thread depends on.
+
+    Returns:
+        The result of the wrapped function.
+    """
+
+    @wraps(func)
+    def limit_wrapper(*args, **kwargs):
+        logger.trace("limit_concurrent_requests wrapper: Enter")
+        semaphore = _get_request_semaphore(max(1, get_config().max_workers))
+        with semaphore:
+            result = func(*args, **kwargs)
+        logger.trace("limit_concurrent_requests wrapper: Exit")
+        return result
+
+    return limit_wrapper
 
 
 def unzip(func):
     """
     Decorator that handles ZIP responses from the ENTSO-E API.
 
-    Wraps query functions to automatically extract ZIP content when the API
-    returns application/zip content-type. Each file in the ZIP archive is
-    extracted and converted to a separate Response object, preserving the
-    original response metadata.
+    Wraps query functions that return a single Response to automatically extract
+    ZIP content when the API returns a ZIP archive, detected by its file signature
+    or the application/zip content-type. Each file in the ZIP archive is extracted
+    and converted to a separate Response object, preserving the original response
+    metadata.
 
     Returns:
         List of Response objects - one for each file found in the ZIP archive,
-        or the original response list if the content is not a ZIP file.
+        or a list holding only the original response if it is not a ZIP file.
     """
 
     @wraps(func)
     def unzip_wrapper(*args, **kwargs) -> list[Response]:
         logger.trace("unzip_wrapper: Enter")
-        # Call the original function to get the list of responses
-        response_list = func(*args, **kwargs)
-
-        # Since query_core returns a list, get the first (and typically only) response
-        response = response_list[0]
+        # Call the original function to get the response
+        response = func(*args, **kwargs)
 
-        # Check if response is ZIP format
-        if response.headers.get("Content-Type") == "application/zip":
+        # Check if response is ZIP format by its signature, falling back to the
+        # content type (allowing for parameters such as charset)
+        content_type = response.headers.get("Content-Type", "").lower()
+        is_zip = response.content[:4] == ZIP_SIGNATURE or content_type.startswith(
+            "application/zip"
+        )
+        if is_zip:
             logger.debug("Response is ZIP format, extracting XML content")
-            # Create a BytesIO object from the response content
+            # Create a BytesIO object from the response content. For an immutable
+            # bytes object CPython shares the buffer instead of copying it.
             zip_buffer = io.BytesIO(response.content)
 
             # Open the ZIP file and extract XML files
             with zipfile.ZipFile(zip_buffer, "r") as zip_file:
-                file_names = zip_file.namelist()
+                # Directory entries carry no content and would yield empty responses
+                file_infos = [info for info in zip_file.infolist() if not info.is_dir()]
 
-                logger.debug(f"Found {len(file_names)} files in ZIP: {file_names}")
+                logger.opt(lazy=True).debug(
+                    "Found {} files in ZIP: {}",
+                    lambda: len(file_infos),
+                    lambda: [info.filename for info in file_infos],
+                )
 
                 responses: list[Response] = []
+                status_code = response.status_code
+                request = response.request
+
+                # Copy the original headers once, replacing the ZIP content type.
+                # Response copies the headers it is given, so they can be reused.
+                headers = response.headers.copy()
+                headers["Content-Type"] = "text/xml; charset=utf-8"
 
-                for file_name in file_names:
-                    logger.trace(f"Extracting file from ZIP: {file_name}")
-                    with zip_file.open(file_name) as xml_file:
-                        xml_content = xml_file.read().decode("utf-8")
+                for info in file_infos:
+                    logger.trace("Extracting file from ZIP: {}", info.filename)
+                    # Keep the raw bytes; the XML parser handles the encoding itself
+                    xml_content = zip_file.read(info)
+
+                    # The archive's Content-Length would otherwise be kept as is
+                    headers["Content-Length"] = str(len(xml_content))
 
-                    # Create a copy of the original response for each file
                     # Create a new Response object with the required attributes
                     new_response = Response(
-                        status_code=response.status_code,
-                        headers={
-                            **response.headers,
-                            "Content-Type": "text/xml; charset=utf-8",
-                        },
-                        content=xml_content.encode("utf-8"),
-                        request=response.request,
+                        status_code=status_code,
+                        headers=headers,
+                        content=xml_content,
+                        request=request,
                     )
                     responses.append(new_response)
                     logger.trace(
-                        f"Created Response object for {file_name} ({len(xml_content)} characters)"
+                        "Created Response object for {} ({} bytes)",
+                        info.filename,
+                        len(xml_content),
                     )
 
-                logger.trace(f"unzip_wrapper: Exit with {len(responses)} responses")
+                logger.trace("unzip_wrapper: Exit with {} responses", len(responses))
                 return responses
 
         logger.trace("unzip_wrapper: Exit with single response")
-        return response_list
+        return [response]
 
     return unzip_wrapper
 
@@ -159,8 +344,8 @@ def split_date_range(func):
 
     When a date range exceeds the specified limit (default 365 days), this decorator
     splits the requested period into multiple chunks and makes parallel API calls
-    for all chunks using ThreadPoolExecutor. Results are combined into a single list
-    of BaseModel instances.
+    for all chunks on a thread pool that is kept alive across calls. Results are
+    combined into a single list of BaseModel instances.
 
     The maximum number of concurrent API calls is controlled by the max_workers
     configuration setting (default: 4), which prevents overwhelming the API or
@@ -177,9 +362,6 @@ def split_date_range(func):
     @wraps(func)
     def range_wrapper(params, *args, **kwargs):
         logger.trace("split_date_range wrapper: Enter")
-        # Get context values
-        max_days_limit = max_days_limit_ctx.get()
-
         # Determine which parameters to use for range checking
         period_start_update = params.get("periodStartUpdate")
         period_end_update = params.get("periodEndUpdate")
@@ -199,6 +381,9 @@ def split_date_range(func):
             logger.trace("split_date_range wrapper: No date range to check")
             return func(params, *args, **kwargs)
 
+        # Only queries with a date range need the limit from the context
+        max_days_limit = max_days_limit_ctx.get()
+
         # Check if the range exceeds the limit
         if not check_date_range_limit(check_start, check_end, max_days=max_days_limit):
             # Range is within limit, make the API call
@@ -206,7 +391,10 @@ def split_date_range(func):
             return func(params, *args, **kwargs)
 
         logger.info(
-            f"Date range {check_start} to {check_end} exceeds {max_days_limit} day limit, splitting query"
+            "Date range {} to {} exceeds {} day limit, splitting query",
+            check_start,
+            check_end,
+            max_days_limit,
         )
 
         # Split the date range into all necessary chunks upfront
@@ -214,27 +402,50 @@ def split_date_range(func):
             check_start, check_end, max_days=max_days_limit
         )
 
-        logger.info(f"Split date range into {len(date_ranges)} chunks")
-        logger.debug(f"Date ranges: {date_ranges}")
-
-        def call_with_range(start_end_tuple: tuple[int, int]):
-            """Helper function to call API with a specific date range."""
-            start, end = start_end_tuple
-            chunk_params = params.copy()
-            chunk_params[split_param_start] = start
-            chunk_params[split_param_end] = end
-            logger.debug(f"Fetching chunk: {start} to {end}")
+        logger.info("Split date range into {} chunks", len(date_ranges))
+        logger.debug("Date ranges: {}", date_ranges)
+
+        # Build the params of all chunks upfront in this thread; plain dicts (not
+        # ChainMap views) because the params are serialized for the cache key and
+        # the request
+        chunk_params_list = [
+            {**params, split_param_start: start, split_param_end: end}
+            for start, end in date_ranges
+        ]
+
+        def call_with_range(chunk_params: dict):
+            """Helper function to call API with the params of a single chunk."""
+            logger.debug(
+                "Fetching chunk: {} to {}",
+                chunk_params[split_param_start],
+                chunk_params[split_param_end],
+            )
             return func(chunk_params, *args, **kwargs)
 
-        # Execute all chunks in parallel
-        with ContextPropagatingThreadPoolExecutor(
-            max_workers=get_config().max_workers, thread_name_prefix="Thread"
-        ) as executor:
-            futures = [executor.submit(call_with_range, dr) for dr in date_ranges]
-            results = [*chain.from_iterable(future.result() for future in futures)]
+        # Execute all chunks in parallel on the shared pool. Pagination inside the
+        # chunks uses its own executor, so chunks never wait on this pool.
+        executor = _get_split_pool(get_config().max_workers)
+        futures = {
+            executor.submit(call_with_range, chunk_params): index
+            for index, chunk_params in enumerate(chunk_params_list)
+        }
+        # Collect chunks as they finish, but keep them in chronological order
+        chunk_results: list[list] = [[]] * len(date_ranges)
+        try:
+            for future in as_completed(futures):
+                chunk_results[futures[future]] = future.result()
+        except BaseException:
+            # Do not leave the remaining chunks queued on the shared pool
+            for future in futures:
+                future.cancel()
+            raise
+
+        results = list(chain.from_iterable(chunk_results))
 
         logger.debug(
-            f"Merged results from {len(date_ranges)} chunks: {len(results)} total results"
+            "Merged results from {} chunks: {} total results",
+            len(date_ranges),
+            len(results),
         )
         logger.trace("split_date_range wrapper: Exit after merge")
         return results
@@ -264,10 +475,11 @@ def handle_acknowledgement(func):
     def ack_wrapper(params, *args, **kwargs) -> BaseModel | None:
         logger.trace("handle_acknowledgement wrapper: Enter")
         xml_model = func(params, *args, **kwargs)
-        name = type(xml_model).__name__
 
-        if "acknowledgementmarketdocument" in name.lower():
-            logger.debug(f"Response is acknowledgement document: {name}")
+        if isinstance(xml_model, ACKNOWLEDGEMENT_DOCUMENTS):
+            logger.debug(
+                "Response is acknowledgement document: {}", type(xml_model).__name__
+            )
             reason = xml_model.reason[0].text
 
             if "No matching data found" in reason:
@@ -278,7 +490,7 @@ def handle_acknowledgement(func):
                 logger.info(reason)
                 raise UnexpectedError("Acknowledgement: Unexpected error occurred.")
             else:
-                logger.error(f"Acknowledgement: {reason}")
+                logger.error("Acknowledgement: {}", reason)
                 raise AcknowledgementDocumentError(reason)
 
         logger.trace("handle_acknowledgement wrapper: Exit with xml_model")
@@ -287,6 +499,59 @@ def handle_acknowledgement(func):
     return ack_wrapper
 
 
+def _fetch_pages_ahead(fetch_page, offsets: range, concurrency: int) -> list[list]:
+    """
+    Fetch pages with up to concurrency pages in flight, consumed in offset order.
+
+    The first page is requested alone, so that a query fitting on one page makes
+    no speculative requests. Requests past the first empty page are cancelled,
+    and their results discarded.
+
+    Args:
+        fetch_page: Function returning the parsed page for an offset
+        offsets: Offsets to request, in order
+        concurrency: Maximum number of pages in flight
+
+    Returns:
+        The non-empty pages before the first empty one, in offset order.
+    """
+    pages: list[list] = []
+    pending_offsets = iter(offsets)
+
+    with ContextPropagatingThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="Page"
+    ) as executor:
+        first_offset = next(pending_offsets)
+        in_flight = deque([(first_offset, executor.submit(fetch_page, first_offset))])
+
+        while in_flight:
+            offset, future = in_flight.popleft()
+            result = future.result()
+
+            if not result:
+                logger.debug(
+                    "Pagination complete at offset {}, no more results", offset
+                )
+                break
+
+            # Keep the page; all pages are merged once at the end
+            pages.append(result)
+            logger.trace("Retrieved {} results at offset {}", len(result), offset)
+
+            # Refill the window with the next pages
+            for next_offset in islice(pending_offsets, concurrency - len(in_flight)):
+                in_flight.append((
+                    next_offset,
+                    executor.submit(fetch_page, next_offset),
+                ))
+
+        # Drop speculative requests past the last page
+        for _, future in in_flight:
+            future.cancel()
+
+    return pages
+
+
 def pagination(func):
     """
     Decorator that handles pagination for API requests with large result sets.
@@ -294,7 +559,16 @@ def pagination(func):
     When an 'offset' parameter is present, this decorator automatically
     makes multiple API calls with increasing offset values until all data
     is retrieved. The increment size is determined by the offset_increment
-    parameter from context. Results from all pages are combined into a single list.
+    parameter from context, the highest offset by the max_offset configuration
+    setting (default: 4800). Pagination stops at the first empty page. Results
+    from all pages are combined into a single list.
+
+    By default pages are fetched strictly one after another. With a higher
+    pagination_concurrency (configuration setting, default: 1) the first page is
+    still requested alone, and once it is not the last one up to that many pages
+    are requested ahead in parallel; whenever a page is consumed the next offset
+    is requested. Results are merged in offset order, and pages beyond the last
+    one are cancelled or discarded.
 
     Returns:
         List of BaseModel instances from all paginated results combined.
@@ -310,46 +584,89 @@ def pagination(func):
 
         # Get offset_increment from context, with default and warning if not set
         offset_increment = offset_increment_ctx.get()
+        config = get_config()
+        concurrency = max(1, config.pagination_concurrency)
 
-        logger.info(f"Starting pagination with increment={offset_increment}")
-
-        merged_result = []
+        logger.info(
+            "Starting pagination with increment={}, concurrency={}",
+            offset_increment,
+            concurrency,
+        )
 
-        for offset in range(
-            0, 4801, offset_increment
-        ):  # 0 to 4800 in increments of offset_increment
-            params["offset"] = offset
-            logger.trace(f"Fetching page at offset {offset}")
+        # 0 to max_offset in increments of offset_increment
+        offsets = range(0, config.max_offset + 1, offset_increment)
 
-            result = func(params, *args, **kwargs)
+        def fetch_page(offset: int):
+            """Helper function to call API for a single page."""
+            logger.trace("Fetching page at offset {}", offset)
+            return func({**params, "offset": offset}, *args, **kwargs)
 
-            if not result:
-                logger.debug(f"Pagination complete at offset {offset}, no more results")
-                break
+        pages: list[list] = []
 
-            # Add results to accumulated list
-            merged_result.extend(result)
-            logger.trace(f"Retrieved {len(result)} results at offset {offset}")
+        if concurrency == 1 or len(offsets) == 1:
+            # Without look-ahead, fetch the pages inline instead of on a pool
+            for offset in offsets:
+                result = fetch_page(offset)
+                if not result:
+                    logger.debug(
+                        "Pagination complete at offset {}, no more results", offset
+                    )
+                    break
+                pages.append(result)
+                logger.trace("Retrieved {} results at offset {}", len(result), offset)
+        else:
+            pages = _fetch_pages_ahead(fetch_page, offsets, concurrency)
 
-        logger.debug(f"Pagination completed with {len(merged_result)} total results")
+        merged_result = list(chain.from_iterable(pages))
+        logger.debug("Pagination completed with {} total results", len(merged_result))
         logger.trace("pagination wrapper: Exit")
         return merged_result
 
     return pagination_wrapper
 
 
+def _parse_retry_after(response: Response) -> float | None:
+    """
+    Parse the Retry-After header of a response.
+
+    Args:
+        response: HTTP Response object
+
+    Returns:
+        Seconds to wait, given either as a number of seconds or as an HTTP date,
+        or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug("Ignoring invalid Retry-After header: {}", value)
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def check_service_unavailable(func):
     """
-    Decorator that checks for 503 Service Unavailable responses from the ENTSO-E API.
+    Decorator that checks for 503 Service Unavailable and 429 Too Many Requests
+    responses from the ENTSO-E API.
 
     Inspects the HTTP response status code and raises a ServiceUnavailableError
-    if a 503 status is detected, which triggers the retry mechanism.
+    if either status is detected, which triggers the retry mechanism. The wait
+    requested by a Retry-After header is passed on with the error.
 
     Returns:
-        The original Response object if no 503 status is found.
+        The original Response object if neither status is found.
 
     Raises:
-        ServiceUnavailableError: When the response has a 503 Service Unavailable status
+        ServiceUnavailableError: When the response has a 503 Service Unavailable
+                                 or 429 Too Many Requests status
     """
 
     @wraps(func)
@@ -357,10 +674,19 @@ def check_service_unavailable(func):
         logger.trace("check_service_unavailable wrapper: Enter")
         response = func(*args, **kwargs)
 
-        # Check response for 503 status
+        # Check response for 503 and 429 status
         if response.status_code == 503:
             logger.info("ENTSO-E API returned 503 Service Unavailable")
-            raise ServiceUnavailableError("ENTSO-E API is unavailable (HTTP 503).")
+            raise ServiceUnavailableError(
+                "ENTSO-E API is unavailable (HTTP 503).",
+                retry_after=_parse_retry_after(response),
+            )
+        if response.status_code == 429:
+            logger.info("ENTSO-E API returned 429 Too Many Requests")
+            raise ServiceUnavailableError(
+                "ENTSO-E API rate limit exceeded (HTTP 429).",
+                retry_after=_parse_retry_after(response),
+            )
 
         logger.trace("check_service_unavailable wrapper: Exit")
         return response
@@ -368,43 +694,169 @@ def check_service_unavailable(func):
     return service_unavailable_wrapper
 
 
+def _cache_key(endpoint_url: str, params: dict) -> str:
+    """Build a stable cache key from the endpoint URL and query parameters."""
+    payload = json.dumps(
+        {"endpoint_url": endpoint_url, "params": params}, sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _reaches_present(params: dict) -> bool:
+    """Check whether the queried period ends at or after the current time."""
+    now = format_entsoe_datetime(datetime.now(timezone.utc))
+    return any(
+        int(params[name]) >= now
+        for name in ("periodEnd", "periodEndUpdate")
+        if params.get(name) is not None
+    )
+
+
+def cache_results(func):
+    """
+    Decorator that caches query results on disk, keyed by the query parameters.
+
+    When a cache directory is configured (cache_dir configuration setting), results
+    of previously successful queries are served from the cache instead of calling
+    the API again. Keys are derived from the endpoint URL and the query parameters;
+    the security token is not part of the key. Empty results are not cached, and
+    cached entries expire after cache_ttl seconds if that setting is given.
+    Queries whose period (periodEnd or periodEndUpdate) reaches the current time
+    bypass the cache, as their results may still change.
+
+    Returns:
+        The cached result if present, otherwise the result of the wrapped function.
+    """
+
+    @wraps(func)
+    def cache_wrapper(params, *args, **kwargs):
+        logger.trace("cache wrapper: Enter")
+        config = get_config()
+        cache = config.cache
+
+        if cache is None:
+            logger.trace("cache wrapper: Exit, caching disabled")
+            return func(params, *args, **kwargs)
+
+        if _reaches_present(params):
+            logger.trace("cache wrapper: Exit, period reaches the present")
+            return func(params, *args, **kwargs)
+
+        key = _cache_key(config.endpoint_url, params)
+        result = cache.get(key)
+
+        if result is not None:
+            logger.debug("Loaded result from cache for params: {}", params)
+            logger.trace("cache wrapper: Exit with cached result")
+            return result
+
+        result = func(params, *args, **kwargs)
+
+        if result:
+            cache.set(key, result, expire=config.cache_ttl)
+            logger.debug("Stored result in cache for params: {}", params)
+
+        logger.trace("cache wrapper: Exit")
+        return result
+
+    return cache_wrapper
+
+
 def retry(func):
     """
     Decorator that catches connection errors, service unavailable errors, waits and retries.
 
-    Args:
-        retry_count: Number of retry attempts (default: 3)
-        retry_delay: Wait time between retries in seconds (default: 10)
+    Only transient failures are retried: httpx transport errors (connection,
+    timeout, network and protocol errors), 503 and 429 responses and unexpected
+    error acknowledgements. Other request errors are raised immediately.
+
+    The number of attempts and the wait time between them are taken from the
+    retries and retry_delay configuration settings, read once per call. If the
+    server sent a Retry-After header, the wait is at least that long, up to
+    MAX_RETRY_DELAY seconds.
+
+    If circuit_breaker_threshold is set, transient failures are also counted by
+    a circuit breaker shared by all requests. After that many consecutive
+    failures, requests raise CircuitOpenError without being made until
+    circuit_breaker_reset seconds have passed, instead of each waiting through
+    all its retries. Any answer of the API closes the circuit again.
     """
 
     @wraps(func)
     def retry_wrapper(*args, **kwargs):
         logger.trace("retry wrapper: Enter")
         config = get_config()
+        retries = config.retries
+        retry_delay = config.retry_delay
+        threshold = config.circuit_breaker_threshold
+        breaker = _get_circuit_breaker(config) if threshold else None
         last_exception = None
 
-        for attempt in range(config.retries):
-            logger.trace(f"Retry attempt {attempt + 1}/{config.retries}")
+        for attempt in range(retries):
+            logger.trace("Retry attempt {}/{}", attempt + 1, retries)
+            if breaker is not None and not breaker.allow(config.circuit_breaker_reset):
+                raise CircuitOpenError(
+                    f"Circuit open after {threshold} consecutive failed requests, "
+                    f"not retrying for up to {config.circuit_breaker_reset}s"
+                ) from last_exception
             try:
                 result = func(*args, **kwargs)
+                if breaker is not None:
+                    breaker.record_success()
                 logger.trace(
-                    f"retry wrapper: Exit successfully on attempt {attempt + 1}"
+                    "retry wrapper: Exit successfully on attempt {}", attempt + 1
                 )
                 return result
-            # Catch connection errors, socket errors, and service unavailable errors
-            except (RequestError, ServiceUnavailableError, UnexpectedError) as e:
+            # Catch transport errors (connection, timeout, network, protocol) and
+            # service unavailable errors, which may succeed on a later attempt
+            except (TransportError, ServiceUnavailableError, UnexpectedError) as e:
                 last_exception = e
-                if attempt < config.retries - 1:
+                circuit_open = breaker is not None and breaker.record_failure(threshold)
+                if attempt < retries - 1:
+                    if circuit_open:
+                        logger.warning(
+                            "Attempt {}/{} failed: {} Circuit open, not retrying",
+                            attempt + 1,
+                            retries,
+                            e,
+                        )
+                        raise CircuitOpenError(
+                            f"Circuit open after {threshold} consecutive failed "
+                            "requests"
+                        ) from e
+                    # Evaluate the delay once so the logged and actual wait agree.
+                    # Wait at least as long as the server asked for, up to the
+                    # upper bound of the default delay
+                    delay = retry_delay(attempt)
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after is not None:
+                        delay = max(delay, min(retry_after, MAX_RETRY_DELAY))
                     logger.warning(
-                        f"Attempt {attempt + 1}/{config.retries} failed: {e} "
-                        f"Retrying in {config.retry_delay(attempt)}s..."
+                        "Attempt {}/{} failed: {} Retrying in {}s...",
+                        attempt + 1,
+                        retries,
+                        e,
+                        round(delay, 2),
                     )
-                    sleep(config.retry_delay(attempt))
+                    sleep(delay)
                 continue
+            except (RequestError, AcknowledgementDocumentError) as e:
+                # Decoding errors or too many redirects fail the same way again.
+                # The API answered, so it is reachable and the circuit closes
+                logger.debug("Not retrying {}: {}", type(e).__name__, e)
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            except Exception:
+                # Local errors (e.g. an invalid token) say nothing about the API
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
 
         # If we've exhausted all retries, raise the last exception
         logger.error(
-            f'All {config.retries} retry attempts failed. You may use entsoe.config.set_config(log_level="DEBUG") for more details.'
+            'All {} retry attempts failed. You may use entsoe.config.set_config(log_level="DEBUG") for more details.',
+            retries,
         )
         if last_exception:
             raise last_exception
@@ -1,33 +1,83 @@
-from httpx import Response, get
+import atexit
+import threading
+
+from httpx import Client, Limits, Response
 from pydantic import BaseModel
-from xsdata_pydantic.bindings import XmlParser
+from xsdata_pydantic.bindings import XmlContext, XmlParser
 
 from ..config.config import get_config, logger
 from ..utils.utils import extract_namespace_and_find_classes
 from .decorators import (
+    cache_results,
     check_service_unavailable,
     handle_acknowledgement,
+    limit_concurrent_requests,
     pagination,
     retry,
     split_date_range,
     unzip,
 )
 
+# Binding metadata of the models is built on first use and cached by the context,
+# so it is shared by all parsers. Parsers keep per-parse state and are not shared.
+XML_CONTEXT = XmlContext()
+
+# HTTP client shared by all requests, so connections and TLS sessions are reused
+_http_client: Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> Client:
+    """
+    Get the HTTP client shared by all requests to the ENTSO-E API.
+
+    Returns the http_client configured with set_config if there is one.
+    Otherwise a shared client is created on first use and keeps connections to
+    the API alive between requests, including requests made from split and
+    pagination workers.
 
+    Returns:
+        Shared httpx.Client instance
+    """
+    configured_client = get_config().http_client
+    if configured_client is not None:
+        return configured_client
+
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            logger.debug("Creating shared HTTP client")
+            # Concurrent requests are already bounded by max_workers, so the pool
+            # keeps every connection alive for reuse instead of only 20 of them
+            _http_client = Client(
+                limits=Limits(max_connections=None, max_keepalive_connections=None)
+            )
+        return _http_client
+
+
+@atexit.register
+def _close_http_client():
+    """Close the shared HTTP client at interpreter exit."""
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+
+
+@limit_concurrent_requests
 @check_service_unavailable
 def query_core(params: dict) -> Response:
     """
     Core function to make HTTP requests to the ENTSO-E API.
 
     Performs a basic HTTP GET request with authentication and timeout handling and checks for service unavailability.
+    Requests are sent with the shared HTTP client, reusing open connections.
     This is the lowest-level function that directly communicates with the API.
 
     Args:
         params: Dictionary of query parameters for the API request
 
     Returns:
-        List containing a single HTTP Response object. Returned as a list
-        to maintain consistency with decorators that may return multiple responses.
+        The HTTP Response object.
     """
     logger.trace("query_core: Enter")
     config = get_config()
@@ -39,24 +89,25 @@ def query_core(params: dict) -> Response:
     params_with_token = {**params, "securityToken": config.security_token}
 
     # Log the API call with sanitized parameters
-    logger.info(f"Making API request with params: {params}")
-    logger.debug(f"Request URL: {config.endpoint_url}, timeout: {config.timeout}s")
+    logger.info("Making API request with params: {}", params)
+    logger.debug("Request URL: {}, timeout: {}s", config.endpoint_url, config.timeout)
 
-    response = get(
+    response = get_http_client().get(
         config.endpoint_url, params=params_with_token, timeout=config.timeout
     )
 
-    content_length = len(response.text) if response.text else 0
     logger.info(
-        f"API response received: status={response.status_code}, size={content_length} bytes"
+        "API response received: status={}, size={} bytes",
+        response.status_code,
+        len(response.content),
     )
-    logger.trace(f"query_core: Exit with status {response.status_code}")
+    logger.trace("query_core: Exit with status {}", response.status_code)
 
     return response
 
 
 @unzip
-def fetch_responses(params: dict) -> list[Response]:
+def fetch_responses(params: dict) -> Response:
     """
     Fetch responses from the ENTSO-E API with unzipping and error handling.
 
@@ -66,13 +117,14 @@ def fetch_responses(params: dict) -> list[Response]:
         params: Dictionary of query parameters for the API request
 
     Returns:
-        List of Response objects. Multiple responses are returned when the API
-        returns a ZIP file containing multiple XML documents.
+        The HTTP Response, which the unzip decorator turns into a list of Response
+        objects. Multiple responses are returned when the API returns a ZIP file
+        containing multiple XML documents.
     """
     logger.trace("fetch_responses: Enter")
     response = query_core(params)
     logger.trace("fetch_responses: Exit")
-    return [response]
+    return response
 
 
 @handle_acknowledgement
@@ -93,21 +145,25 @@ def parse_response(response: Response) -> BaseModel | None:
         or None if the response is an acknowledgement with no matching data.
     """
     logger.trace("parse_response: Enter")
-    logger.debug(f"Parsing response with status {response.status_code}")
+    logger.debug("Parsing response with status {}", response.status_code)
 
     name, matching_class = extract_namespace_and_find_classes(response)
 
     class_name = matching_class.__name__ if matching_class else None
-    logger.debug(f"Extracted namespace: {name}, matching class: {class_name}")
+    logger.debug("Extracted namespace: {}, matching class: {}", name, class_name)
 
-    xml_model = XmlParser().from_string(response.text, matching_class)
+    # Parse the raw bytes; the XML declaration determines the encoding
+    xml_model = XmlParser(context=XML_CONTEXT).from_bytes(
+        response.content, matching_class
+    )
 
-    logger.debug(f"Successfully parsed XML response into {type(xml_model).__name__}")
-    logger.trace(f"parse_response: Exit with {type(xml_model).__name__}")
+    logger.debug("Successfully parsed XML response into {}", type(xml_model).__name__)
+    logger.trace("parse_response: Exit with {}", type(xml_model).__name__)
 
     return xml_model
 
 
+@cache_results
 @retry
 def query_and_parse(params: dict) -> list[BaseModel]:
     """
@@ -115,7 +171,8 @@ def query_and_parse(params: dict) -> list[BaseModel]:
 
     This function orchestrates fetching responses from the API and parsing them
     into Pydantic models. It includes retry logic for transient failures and
-    checks for unexpected errors in acknowledgement documents.
+    checks for unexpected errors in acknowledgement documents. If a cache
+    directory is configured, results are served from the on-disk cache.
 
     Args:
         params: Dictionary of query parameters for the API request
@@ -128,7 +185,7 @@ def query_and_parse(params: dict) -> list[BaseModel]:
 
     responses = fetch_responses(params)
 
-    logger.debug(f"Received {len(responses)} response(s), parsing each")
+    logger.debug("Received {} response(s), parsing each", len(responses))
 
     # Parse each response and filter out None results (from "no matching data" acknowledgements)
     results = [
@@ -137,8 +194,8 @@ def query_and_parse(params: dict) -> list[BaseModel]:
         if (parsed := parse_response(response)) is not None
     ]
 
-    logger.debug(f"Parsed {len(results)} result(s)")
-    logger.trace(f"query_and_parse: Exit with {len(results)} result(s)")
+    logger.debug("Parsed {} result(s)", len(results))
+    logger.trace("query_and_parse: Exit with {} result(s)", len(results))
 
     return results
 
@@ -177,6 +234,6 @@ def query_api(params: dict[str, str]) -> list[BaseModel]:
 
     results = query_and_parse(params)
 
-    logger.trace(f"query_api: Exit with {len(results)} result(s)")
+    logger.trace("query_api: Exit with {} result(s)", len(results))
 
     return results
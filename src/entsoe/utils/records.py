@@ -5,9 +5,10 @@ from pydantic import BaseModel
 from ..config.config import logger
 
 
-def _deduplicate_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Remove duplicate records while preserving order."""
-    seen = set()
+def _deduplicate_records(
+    records: List[Dict[str, Any]], seen: set[frozenset]
+) -> List[Dict[str, Any]]:
+    """Remove records already in seen while preserving order, adding the new ones."""
     unique_records = []
     for record in records:
         record_key = frozenset(record.items())
@@ -61,52 +62,62 @@ def normalize_to_records(
         [{"user": "john", "orders.id": 1}]
     """
 
-    if ignore_fields is None:
-        ignore_fields = []
+    ignore_set = frozenset(ignore_fields) if ignore_fields else frozenset()
+    return _normalize_to_records(data, parent_key, sep, ignore_set)
+
 
-    def _filter_ignored_fields(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Filter out ignored fields from a record."""
-        return {k: v for k, v in record.items() if k not in ignore_fields}
+def _filter_ignored_fields(
+    record: Dict[str, Any], ignore_set: frozenset[str]
+) -> Dict[str, Any]:
+    """Filter out ignored fields from a record, copying it only if one is present."""
+    if ignore_set.isdisjoint(record):
+        return record
+    return {k: v for k, v in record.items() if k not in ignore_set}
 
+
+def _normalize_to_records(
+    data: Dict[str, Any] | List[Any] | Any,
+    parent_key: str,
+    sep: str,
+    ignore_set: frozenset[str],
+) -> List[Dict[str, Any]]:
+    """Recursive implementation of normalize_to_records."""
     if isinstance(data, dict):
         items = {}
         for k, v in data.items():
             new_key = f"{parent_key}{sep}{k}" if parent_key else k
             if isinstance(v, dict):
-                sub_records = normalize_to_records(
-                    v, new_key, sep=sep, ignore_fields=ignore_fields
-                )
+                sub_records = _normalize_to_records(v, new_key, sep, ignore_set)
                 items.update(sub_records[0])  # merge dict
             elif isinstance(v, list):
                 # Expand list elements into multiple records
                 list_records = []
                 for elem in v:
                     if isinstance(elem, dict):
-                        sub_records = normalize_to_records(
-                            elem, new_key, sep=sep, ignore_fields=ignore_fields
+                        sub_records = _normalize_to_records(
+                            elem, new_key, sep, ignore_set
                         )
                         list_records.extend(sub_records)
                     else:
-                        list_records.append({new_key: elem})
-                # Cross join if multiple records, else just keep one
+                        list_records.append(
+                            _filter_ignored_fields({new_key: elem}, ignore_set)
+                        )
+                # Cross join if multiple records, else just keep one. The list
+                # records are already filtered, so the parent fields are filtered
+                # once instead of once per record.
                 if list_records:
-                    return [
-                        _filter_ignored_fields(dict(items, **lr)) for lr in list_records
-                    ]
+                    base = _filter_ignored_fields(items, ignore_set)
+                    return [base | lr for lr in list_records]
             else:
                 items[new_key] = v
-        return [_filter_ignored_fields(items)]
+        return [_filter_ignored_fields(items, ignore_set)]
     elif isinstance(data, list):
         records = []
         for elem in data:
-            records.extend(
-                normalize_to_records(
-                    elem, parent_key, sep=sep, ignore_fields=ignore_fields
-                )
-            )
+            records.extend(_normalize_to_records(elem, parent_key, sep, ignore_set))
         return records
     else:
-        return [_filter_ignored_fields({parent_key: data})]
+        return [_filter_ignored_fields({parent_key: data}, ignore_set)]
 
 
 def extract_records(
@@ -155,52 +166,54 @@ def extract_records(
     if isinstance(data, BaseModel):
         data_list = [data]
     elif isinstance(data, list):
-        for item in data:
-            if not isinstance(item, BaseModel):
-                raise TypeError(
-                    f"Expected all items in the list to be BaseModel instances, got {type(item)}"
-                )
         data_list = data
-
-        # Check if all BaseModel instances have the same type
-        if len(data_list) > 1:
-            first_type = type(data_list[0])
-            different_types = [
-                type(item) for item in data_list if type(item) is not first_type
-            ]
-            if different_types:
-                unique_types = set([type(item).__name__ for item in data_list])
-                logger.warning(
-                    f"Mixed BaseModel types detected in list: {sorted(unique_types)}. "
-                    "This may result in inconsistent record structures."
-                )
     else:
         raise TypeError(
             f"Expected data to be a BaseModel or list of BaseModel instances, got {type(data)}"
         )
 
-    data_dict = [item.model_dump(mode="json") for item in data_list]
+    # Validate, serialize and flatten every model in a single pass. With a
+    # domain, only the domain is serialized, not the rest of each model.
+    include = {domain} if domain else None
+    model_types = set()
     all_records = []
-
-    if domain:
-        # Check if domain exists in all dictionaries
-        available_keys = set().union(*(d.keys() for d in data_dict))
-        if domain not in available_keys:
-            raise KeyError(
-                f"Domain '{domain}' not found in data. Available keys: {available_keys}"
+    # Keys of the records kept so far; duplicates are dropped as each model is
+    # flattened, so they never accumulate in all_records
+    seen: set[frozenset] = set()
+    for item in data_list:
+        if not isinstance(item, BaseModel):
+            raise TypeError(
+                f"Expected all items in the list to be BaseModel instances, got {type(item)}"
             )
+        model_types.add(type(item))
+        item_dict = item.model_dump(mode="json", include=include)
+        if domain:
+            if domain not in item_dict:
+                continue
+            item_dict = item_dict[domain]
+        records = normalize_to_records(item_dict, ignore_fields=ignore_fields)
+        if deduplicate:
+            records = _deduplicate_records(records, seen)
+        all_records.extend(records)
+
+    # Check if all BaseModel instances have the same type
+    if len(model_types) > 1:
+        unique_types = {model_type.__name__ for model_type in model_types}
+        logger.warning(
+            f"Mixed BaseModel types detected in list: {sorted(unique_types)}. "
+            "This may result in inconsistent record structures."
+        )
 
-        # Extract the domain from each dictionary and flatten all results
-        for item_dict in data_dict:
-            if domain in item_dict:
-                domain_records = normalize_to_records(
-                    item_dict[domain], ignore_fields=ignore_fields
-                )
-                all_records.extend(domain_records)
-    else:
-        for item_dict in data_dict:
-            all_records.extend(
-                normalize_to_records(item_dict, ignore_fields=ignore_fields)
-            )
+    # Check if domain exists in the fields of the models; the available keys
+    # are only collected for the error message
+    if domain and not any(
+        domain in model_type.model_fields for model_type in model_types
+    ):
+        available_keys = set().union(
+            *(model_type.model_fields for model_type in model_types)
+        )
+        raise KeyError(
+            f"Domain '{domain}' not found in data. Available keys: {available_keys}"
+        )
 
-    return _deduplicate_records(all_records) if deduplicate else all_records
+    return all_records
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Literal
 
 import isodate
@@ -6,6 +7,12 @@ import isodate
 from ..config.config import logger
 
 
+@lru_cache(maxsize=64)
+def _parse_duration(resolution: str) -> timedelta | isodate.Duration:
+    """Parse an ISO 8601 duration; cached as records share a few resolutions."""
+    return isodate.parse_duration(resolution)
+
+
 def calculate_timestamp(
     start: str,
     resolution: str,
@@ -50,7 +57,7 @@ def calculate_timestamp(
         2016-01-01T00:00:00+00:00
     """
     start_dt = datetime.fromisoformat(start)
-    duration = isodate.parse_duration(resolution)
+    duration = _parse_duration(resolution)
     if interval_type == "end":
         timestamp = start_dt + (duration * position)
     elif interval_type == "start":
@@ -148,15 +155,24 @@ def add_timestamps(
 
     enriched_records = []
     missing_fields_logged = False
+    # Resolved keys per record layout; records from one extract share their keys
+    field_keys_by_layout: Dict[tuple, tuple] = {}
 
     for i, record in enumerate(records):
         # Create a copy to avoid modifying the original
         enriched_record = record.copy()
 
-        # Find the actual keys in the record
-        actual_start_field = find_field_key(record, start_field)
-        actual_resolution_field = find_field_key(record, resolution_field)
-        actual_position_field = find_field_key(record, position_field)
+        # Find the actual keys in the record, once per key layout
+        layout = tuple(record)
+        field_keys = field_keys_by_layout.get(layout)
+        if field_keys is None:
+            field_keys = (
+                find_field_key(record, start_field),
+                find_field_key(record, resolution_field),
+                find_field_key(record, position_field),
+            )
+            field_keys_by_layout[layout] = field_keys
+        actual_start_field, actual_resolution_field, actual_position_field = field_keys
 
         # Check if all required fields are present
         missing_fields = []
@@ -170,9 +186,10 @@ def add_timestamps(
         if missing_fields:
             if not missing_fields_logged:
                 logger.debug(
-                    f"Skipping timestamp calculation: "
-                    f"missing required fields: {missing_fields}. "
-                    f"Available keys: {list(record.keys())[:3]}..."
+                    "Skipping timestamp calculation: "
+                    "missing required fields: {}. Available keys: {}...",
+                    missing_fields,
+                    list(record)[:3],
                 )
                 missing_fields_logged = True
             enriched_records.append(enriched_record)
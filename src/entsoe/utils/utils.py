@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 import inspect
+import io
 from xml.etree import ElementTree as ET
 
 import entsoe.xml_models as xml_models
@@ -22,9 +24,18 @@ def parse_entsoe_datetime(date_int: int) -> datetime:
 
     Returns:
         datetime object
+
+    Raises:
+        ValueError: If any component is out of range
     """
-    date_str = str(date_int)
-    return datetime.strptime(date_str, "%Y%m%d%H%M")
+    # Integer arithmetic is much cheaper than strptime for this fixed layout
+    return datetime(
+        date_int // 100000000,
+        date_int // 1000000 % 100,
+        date_int // 10000 % 100,
+        date_int // 100 % 100,
+        date_int % 100,
+    )
 
 
 def format_entsoe_datetime(dt: datetime) -> int:
@@ -37,7 +48,21 @@ def format_entsoe_datetime(dt: datetime) -> int:
     Returns:
         Date in YYYYMMDDHHMM format as integer
     """
-    return int(dt.strftime("%Y%m%d%H%M"))
+    return (
+        dt.year * 100000000
+        + dt.month * 1000000
+        + dt.day * 10000
+        + dt.hour * 100
+        + dt.minute
+    )
+
+
+@lru_cache(maxsize=1024)
+def _range_days(period_start: int, period_end: int) -> int:
+    """Number of whole days between two dates in YYYYMMDDHHMM format."""
+    return (
+        parse_entsoe_datetime(period_end) - parse_entsoe_datetime(period_start)
+    ).days
 
 
 def check_date_range_limit(
@@ -55,20 +80,47 @@ def check_date_range_limit(
         True if range exceeds limit, False otherwise
     """
     logger.trace(
-        f"check_date_range_limit: Enter with {period_start} to {period_end}, max_days={max_days}"
+        "check_date_range_limit: Enter with {} to {}, max_days={}",
+        period_start,
+        period_end,
+        max_days,
     )
 
-    start_dt = parse_entsoe_datetime(period_start)
-    end_dt = parse_entsoe_datetime(period_end)
-    diff = end_dt - start_dt
+    days = _range_days(period_start, period_end)
 
-    exceeds_limit = diff.days > max_days
-    logger.debug(f"Date range spans {diff.days} days, exceeds limit: {exceeds_limit}")
-    logger.trace(f"check_date_range_limit: Exit with {exceeds_limit}")
+    exceeds_limit = days > max_days
+    logger.debug("Date range spans {} days, exceeds limit: {}", days, exceeds_limit)
+    logger.trace("check_date_range_limit: Exit with {}", exceeds_limit)
 
     return exceeds_limit
 
 
+@lru_cache(maxsize=1024)
+def _split_date_range(
+    period_start: int, period_end: int, max_days: int
+) -> tuple[tuple[int, int], ...]:
+    """Compute the chunks for split_date_range; cached as the result is immutable."""
+    date_ranges = []
+    current_start = period_start
+    # Keep the chunk start as a datetime so that each chunk costs one
+    # timedelta addition and one format instead of a parse/format round trip
+    current_start_dt = parse_entsoe_datetime(period_start)
+    end_dt = parse_entsoe_datetime(period_end)
+    step = timedelta(days=max_days)
+
+    # Add full chunks while the remaining range exceeds the limit
+    while (end_dt - current_start_dt).days > max_days:
+        pivot_dt = current_start_dt + step
+        period_pivot = format_entsoe_datetime(pivot_dt)
+        date_ranges.append((current_start, period_pivot))
+        current_start, current_start_dt = period_pivot, pivot_dt
+
+    # Last chunk - add remaining range
+    date_ranges.append((current_start, period_end))
+
+    return tuple(date_ranges)
+
+
 def split_date_range(
     period_start: int, period_end: int, max_days: int = 365
 ) -> list[tuple[int, int]]:
@@ -84,54 +136,23 @@ def split_date_range(
         List of tuples containing (start, end) dates in YYYYMMDDHHMM format for each chunk
     """
     logger.trace(
-        f"split_date_range: Enter with {period_start} to {period_end}, max_days={max_days}"
+        "split_date_range: Enter with {} to {}, max_days={}",
+        period_start,
+        period_end,
+        max_days,
     )
 
-    date_ranges = []
-    current_start = period_start
-    end_dt = parse_entsoe_datetime(period_end)
-
-    while True:
-        # Check if remaining range is within limit
-        current_start_dt = parse_entsoe_datetime(current_start)
-        remaining_days = (end_dt - current_start_dt).days
+    date_ranges = list(_split_date_range(period_start, period_end, max_days))
 
-        if remaining_days <= max_days:
-            # Last chunk - add remaining range
-            date_ranges.append((current_start, period_end))
-            break
-
-        # Calculate pivot date for this chunk
-        pivot_dt = current_start_dt + timedelta(days=max_days)
-        period_pivot = format_entsoe_datetime(pivot_dt)
-
-        # Add this chunk
-        date_ranges.append((current_start, period_pivot))
-
-        # Move to next chunk
-        current_start = period_pivot
-
-    logger.debug(f"Split into {len(date_ranges)} chunks: {date_ranges}")
-    logger.trace(f"split_date_range: Exit with {len(date_ranges)} chunks")
+    logger.debug("Split into {} chunks: {}", len(date_ranges), date_ranges)
+    logger.trace("split_date_range: Exit with {} chunks", len(date_ranges))
 
     return date_ranges
 
 
-def extract_namespace_and_find_classes(response) -> tuple[str, type]:
-    logger.trace("extract_namespace_and_find_classes: Enter")
-    logger.debug("Extracting namespace from XML response")
-
-    root = ET.fromstring(response.text)
-    if root.tag[0] == "{":
-        namespace = root.tag[1:].split("}")[0]
-    else:
-        raise ValueError("No default namespace found in root element")
-
-    if not namespace:
-        raise ValueError("Empty namespace found in root element")
-
-    logger.debug(f"Extracted namespace: {namespace}")
-
+@lru_cache(maxsize=64)
+def _find_class_for_namespace(namespace: str) -> type:
+    """Find the xml_models class for a namespace; cached as the models are fixed."""
     matching_classes = []
 
     # Get all classes from the xml_models module
@@ -140,7 +161,7 @@ def extract_namespace_and_find_classes(response) -> tuple[str, type]:
             if obj.Meta.namespace == namespace:
                 matching_classes.append((name, obj))
 
-    logger.trace(f"Found {len(matching_classes)} matching classes for namespace")
+    logger.trace("Found {} matching classes for namespace", len(matching_classes))
 
     if len(matching_classes) == 0:
         raise ValueError(f"No classes found matching namespace '{namespace}'")
@@ -150,10 +171,30 @@ def extract_namespace_and_find_classes(response) -> tuple[str, type]:
             f"Multiple classes found matching namespace '{namespace}': {class_names}"
         )
 
-    selected_class = matching_classes[0][1]
-    logger.debug(f"Selected class: {selected_class.__name__}")
+    return matching_classes[0][1]
+
+
+def extract_namespace_and_find_classes(response) -> tuple[str, type]:
+    logger.trace("extract_namespace_and_find_classes: Enter")
+    logger.debug("Extracting namespace from XML response")
+
+    # Only the root element is needed; stop parsing at its start tag instead of
+    # building the tree of the whole document
+    _, root = next(ET.iterparse(io.BytesIO(response.content), events=("start",)))
+    if root.tag[0] == "{":
+        namespace = root.tag[1:].split("}")[0]
+    else:
+        raise ValueError("No default namespace found in root element")
+
+    if not namespace:
+        raise ValueError("Empty namespace found in root element")
+
+    logger.debug("Extracted namespace: {}", namespace)
+
+    selected_class = _find_class_for_namespace(namespace)
+    logger.debug("Selected class: {}", selected_class.__name__)
     logger.trace(
-        f"extract_namespace_and_find_classes: Exit with {selected_class.__name__}"
+        "extract_namespace_and_find_classes: Exit with {}", selected_class.__name__
     )
 
     return namespace, selected_class
@@ -2,23 +2,44 @@
 
 import pytest
 
+from entsoe.Base.Base import Base
 from entsoe.config.config import logger
 
 
+@pytest.fixture(scope="module")
+def base_a44():
+    """Base instance for an A44 query, shared by the tests of a module."""
+    return Base(
+        document_type="A44",
+        period_start=202012312300,
+        period_end=202101022300,
+    )
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Replace the retry sleep with a list that records the requested delays."""
+    delays = []
+    monkeypatch.setattr("entsoe.query.decorators.sleep", delays.append)
+    return delays
+
+
 @pytest.fixture(autouse=True)
 def cleanup_logger():
     """Fixture to clean up logger handlers before and after each test."""
     # Store the initial handler IDs
-    initial_handlers = list(logger._core.handlers.keys())
+    initial_handlers = frozenset(logger._core.handlers)
 
     yield
 
-    # Clean up any handlers added during the test
-    current_handlers = list(logger._core.handlers.keys())
-    for handler_id in current_handlers:
-        if handler_id not in initial_handlers:
-            try:
-                logger.remove(handler_id)
-            except ValueError:
-                # Handler may have already been removed; safe to ignore.
-                pass
+    # Clean up any handlers added during the test. Loguru replaces the handlers
+    # dict on add/remove, so it is read again; most tests add none.
+    current_handlers = logger._core.handlers.keys()
+    if current_handlers <= initial_handlers:
+        return
+    for handler_id in list(current_handlers - initial_handlers):
+        try:
+            logger.remove(handler_id)
+        except ValueError:
+            # Handler may have already been removed; safe to ignore.
+            pass
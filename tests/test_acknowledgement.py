@@ -0,0 +1,62 @@
+"""Test module for verifying acknowledgement document handling."""
+
+from httpx import Response
+import pytest
+
+from entsoe.query.decorators import (
+    AcknowledgementDocumentError,
+    UnexpectedError,
+)
+from entsoe.query.query_api import parse_response
+
+ACKNOWLEDGEMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Acknowledgement_MarketDocument
+    xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
+    <mRID>1a2b3c4d-5e6f-7a8b-9c0d-1e2f3a4b5c6d</mRID>
+    <createdDateTime>2024-08-20T10:00:00Z</createdDateTime>
+    <sender_MarketParticipant.mRID codingScheme="A01">10X1001A1001A450</sender_MarketParticipant.mRID>
+    <sender_MarketParticipant.marketRole.type>A32</sender_MarketParticipant.marketRole.type>
+    <receiver_MarketParticipant.mRID codingScheme="A01">10X1001A1001A39I</receiver_MarketParticipant.mRID>
+    <receiver_MarketParticipant.marketRole.type>A39</receiver_MarketParticipant.marketRole.type>
+    <received_MarketDocument.createdDateTime>2024-08-20T10:00:00Z</received_MarketDocument.createdDateTime>
+    <Reason>
+        <code>999</code>
+        <text>{text}</text>
+    </Reason>
+</Acknowledgement_MarketDocument>
+"""
+
+
+def make_acknowledgement(text: str) -> Response:
+    """Build a Response holding an acknowledgement document with the given reason."""
+    return Response(
+        status_code=200, content=ACKNOWLEDGEMENT_XML.format(text=text).encode()
+    )
+
+
+class TestHandleAcknowledgement:
+    """Test class for handle_acknowledgement decorator functionality."""
+
+    def test_no_matching_data_returns_none(self):
+        """Test that 'No matching data found' acknowledgements are mapped to None."""
+        response = make_acknowledgement(
+            "No matching data found for Data item Day-ahead Prices [12.1.D]"
+        )
+
+        assert parse_response(response) is None
+
+    def test_unexpected_error_raises_for_retry(self):
+        """Test that transient server errors raise UnexpectedError."""
+        response = make_acknowledgement("Unexpected error occurred.")
+
+        with pytest.raises(UnexpectedError):
+            parse_response(response)
+
+    def test_other_reasons_raise_acknowledgement_error(self):
+        """Test that other acknowledgements raise with the reason as message."""
+        response = make_acknowledgement(
+            "The amount of requested data exceeds allowed limit."
+        )
+
+        with pytest.raises(AcknowledgementDocumentError, match="exceeds allowed limit"):
+            parse_response(response)
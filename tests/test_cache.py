@@ -0,0 +1,119 @@
+"""Test module for verifying the on-disk result cache."""
+
+from datetime import datetime, timedelta, timezone
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from entsoe import set_config
+from entsoe.config import get_config
+from entsoe.query.decorators import cache_results
+from entsoe.utils.utils import format_entsoe_datetime
+
+pytest.importorskip("diskcache")
+
+
+class TestCacheResults:
+    """Test class for cache_results decorator functionality."""
+
+    def teardown_method(self):
+        """Restore the default configuration without a cache."""
+        set_config()
+
+    def test_cache_disabled_by_default(self):
+        """Test that results are not cached when no cache_dir is configured."""
+        set_config()
+        calls = []
+
+        @cache_results
+        def query(params):
+            calls.append(params)
+            return ["result"]
+
+        query({"documentType": "A44"})
+        query({"documentType": "A44"})
+
+        assert get_config().cache is None
+        assert len(calls) == 2
+
+    def test_cache_hit_skips_call(self, tmp_path):
+        """Test that repeated queries with the same params are served from cache."""
+        set_config(cache_dir=str(tmp_path))
+        calls = []
+
+        @cache_results
+        def query(params):
+            calls.append(params)
+            return [f"result_{params['offset']}"]
+
+        assert query({"documentType": "A44", "offset": 0}) == ["result_0"]
+        assert query({"offset": 0, "documentType": "A44"}) == ["result_0"]
+        assert query({"documentType": "A44", "offset": 100}) == ["result_100"]
+
+        # Key order does not matter, different params are cached separately
+        assert len(calls) == 2
+
+    def test_empty_results_are_not_cached(self, tmp_path):
+        """Test that empty results are fetched again on the next query."""
+        set_config(cache_dir=str(tmp_path))
+        calls = []
+
+        @cache_results
+        def query(params):
+            calls.append(params)
+            return []
+
+        query({"documentType": "A44"})
+        query({"documentType": "A44"})
+
+        assert len(calls) == 2
+
+    def test_set_config_closes_previous_cache(self, tmp_path):
+        """Test that replacing the configuration closes the opened cache."""
+        set_config(cache_dir=str(tmp_path))
+        cache = get_config().cache
+
+        with patch.object(cache, "close", wraps=cache.close) as close:
+            set_config(cache_dir=str(tmp_path))
+
+        close.assert_called_once_with()
+        assert get_config().cache is not cache
+
+    @pytest.mark.parametrize("param", ["periodEnd", "periodEndUpdate"])
+    def test_period_reaching_present_is_not_cached(self, tmp_path, param):
+        """Test that queries whose period ends in the future bypass the cache."""
+        set_config(cache_dir=str(tmp_path))
+        calls = []
+        period_end = format_entsoe_datetime(
+            datetime.now(timezone.utc) + timedelta(days=1)
+        )
+
+        @cache_results
+        def query(params):
+            calls.append(params)
+            return ["result"]
+
+        query({"documentType": "A44", param: period_end})
+        query({"documentType": "A44", param: period_end})
+
+        assert len(calls) == 2
+
+    def test_cache_opened_once_by_concurrent_access(self, tmp_path):
+        """Test that threads accessing the cache at the same time share one."""
+        set_config(cache_dir=str(tmp_path))
+        config = get_config()
+        barrier = threading.Barrier(8)
+        caches = []
+
+        def access():
+            barrier.wait()
+            caches.append(config.cache)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(cache is caches[0] for cache in caches)
@@ -3,58 +3,45 @@
 import pytest
 
 from entsoe.Balancing import AcceptedAggregatedOffers, CrossBorderBalancing
-from entsoe.Base.Base import Base, ValidationError
+from entsoe.Base.Base import ValidationError
 from entsoe.Market import EnergyPrices
 
+# Query period shared by the tests in this module
+PERIOD = {"period_start": 202012312300, "period_end": 202101022300}
+
+
+@pytest.fixture
+def base(base_a44):
+    """Shared Base instance whose params are restored after each test."""
+    saved_params = base_a44.params.copy()
+    yield base_a44
+    base_a44.params = saved_params
+
 
 class TestEICValidation:
     """Test cases for EIC code validation."""
 
-    def test_validate_eic_code_valid(self):
+    def test_validate_eic_code_valid(self, base):
         """Test validation passes for valid EIC codes."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should not raise exception for valid EIC code
         base.validate_eic_code("10Y1001A1001A82H", "test_parameter")
 
-    def test_validate_eic_code_invalid(self):
+    def test_validate_eic_code_invalid(self, base):
         """Test validation fails for invalid EIC codes."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should raise ValidationError for invalid EIC code
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC_CODE' for parameter 'test_parameter'",
+        ):
             base.validate_eic_code("INVALID_EIC_CODE", "test_parameter")
 
-        assert "Invalid EIC code 'INVALID_EIC_CODE'" in str(exc_info.value)
-        assert "test_parameter" in str(exc_info.value)
-
-    def test_validate_eic_code_none(self):
+    def test_validate_eic_code_none(self, base):
         """Test validation passes for None values."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should not raise exception for None
         base.validate_eic_code(None, "test_parameter")
 
-    def test_add_domain_params_valid_eic(self):
+    def test_add_domain_params_valid_eic(self, base):
         """Test add_domain_params with valid EIC codes."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should not raise exception for valid EIC codes
         base.add_domain_params(
             in_domain="10Y1001A1001A82H",
@@ -66,68 +53,58 @@ class TestEICValidation:
         assert base.params["out_Domain"] == "10YGB----------A"
         assert base.params["biddingZone_Domain"] == "10YBE----------2"
 
-    def test_add_domain_params_invalid_eic(self):
+    def test_add_domain_params_invalid_eic(self, base):
         """Test add_domain_params with invalid EIC codes."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should raise ValidationError for invalid EIC code
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'in_domain'",
+        ):
             base.add_domain_params(in_domain="INVALID_EIC")
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "in_domain" in str(exc_info.value)
-
     def test_balancing_class_eic_validation(self):
         """Test EIC validation in Balancing-derived classes."""
         # Should raise ValidationError for invalid control_area_domain
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'control_area_domain'",
+        ):
             AcceptedAggregatedOffers(
-                period_start=202012312300,
-                period_end=202101022300,
+                **PERIOD,
                 control_area_domain="INVALID_EIC",
             )
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "control_area_domain" in str(exc_info.value)
-
     def test_cross_border_balancing_eic_validation(self):
         """Test EIC validation in specific parameter classes."""
         # Should raise ValidationError for invalid acquiring_domain
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'acquiring_domain'",
+        ):
             CrossBorderBalancing(
-                period_start=202012312300,
-                period_end=202101022300,
+                **PERIOD,
                 acquiring_domain="INVALID_EIC",
                 connecting_domain="10YBE----------2",
             )
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "acquiring_domain" in str(exc_info.value)
-
     def test_market_class_eic_validation(self):
         """Test EIC validation in Market-derived classes."""
         # Should raise ValidationError for invalid in_domain
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'in_domain'",
+        ):
             EnergyPrices(
-                period_start=202012312300,
-                period_end=202101022300,
+                **PERIOD,
                 in_domain="INVALID_EIC",
                 out_domain="10YGB----------A",
             )
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "in_domain" in str(exc_info.value)
-
     def test_valid_eic_construction_succeeds(self):
         """Test that construction with valid EIC codes succeeds."""
         # Should succeed with valid and matching EIC codes
         energy_prices = EnergyPrices(
-            period_start=202012312300,
-            period_end=202101022300,
+            **PERIOD,
             in_domain="10Y1001A1001A82H",
             out_domain="10Y1001A1001A82H",  # Must be same for EnergyPrices
         )
@@ -139,8 +116,7 @@ class TestEICValidation:
         """Test that construction with valid EIC codes succeeds for specific classes."""
         # Should succeed with valid EIC codes
         cross_border = CrossBorderBalancing(
-            period_start=202012312300,
-            period_end=202101022300,
+            **PERIOD,
             acquiring_domain="10Y1001A1001A82H",
             connecting_domain="10YGB----------A",
         )
@@ -148,40 +124,28 @@ class TestEICValidation:
         assert cross_border.params["acquiring_Domain"] == "10Y1001A1001A82H"
         assert cross_border.params["connecting_Domain"] == "10YGB----------A"
 
-    def test_mixed_valid_invalid_eic_validation(self):
+    def test_mixed_valid_invalid_eic_validation(self, base):
         """Test validation with mixed valid and invalid EIC codes."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should fail on the first invalid EIC code
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'out_domain'",
+        ):
             base.add_domain_params(
                 in_domain="10Y1001A1001A82H",  # valid
                 out_domain="INVALID_EIC",  # invalid
                 bidding_zone_domain="10YBE----------2",  # valid
             )
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "out_domain" in str(exc_info.value)
-
-    def test_registered_resource_eic_validation(self):
+    def test_registered_resource_eic_validation(self, base):
         """Test EIC validation for registered_resource parameter."""
-        base = Base(
-            document_type="A44",
-            period_start=202012312300,
-            period_end=202101022300,
-        )
-
         # Should raise ValidationError for invalid registered_resource
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError,
+            match="Invalid EIC code 'INVALID_EIC' for parameter 'registered_resource'",
+        ):
             base.add_resource_params(registered_resource="INVALID_EIC")
 
-        assert "Invalid EIC code 'INVALID_EIC'" in str(exc_info.value)
-        assert "registered_resource" in str(exc_info.value)
-
         # Should succeed with valid EIC code
         base.add_resource_params(registered_resource="10Y1001A1001A82H")
         assert base.params["registeredResource"] == "10Y1001A1001A82H"
@@ -5,21 +5,44 @@ import pytest
 from entsoe.Base.Outages import Outages
 from entsoe.OMI.OMI import OMI
 
+# Query period shared by the tests in this module
+PERIOD = {"period_start": 202301010000, "period_end": 202301020000}
+
+
+@pytest.fixture(scope="module")
+def sample_omi():
+    """OMI query with all optional parameters, shared by read-only tests."""
+    return OMI(
+        control_area_domain="10YBE----------2",
+        **PERIOD,
+        doc_status="A05",
+        m_rid="test_mrid",
+        offset=100,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_outages():
+    """Outages query with all optional parameters, shared by read-only tests."""
+    return Outages(
+        document_type="A77",
+        **PERIOD,
+        bidding_zone_domain="10YBE----------2",
+        business_type="A53",
+        registered_resource="10Y1001A1001A82H",  # Valid EIC code
+        doc_status="A05",
+        m_rid="test_mrid",
+        offset=100,
+    )
+
 
 class TestEncapsulation:
     """Test that OMI and Outages classes properly use Base class encapsulation."""
 
-    def test_omi_parameter_initialization(self):
+    def test_omi_parameter_initialization(self, sample_omi):
         """Test that OMI class properly initializes parameters using base
         class methods."""
-        omi = OMI(
-            control_area_domain="10YBE----------2",
-            period_start=202301010000,
-            period_end=202301020000,
-            doc_status="A05",
-            m_rid="test_mrid",
-            offset=100,
-        )
+        omi = sample_omi
 
         # Verify that parameters are set correctly
         assert omi.params["documentType"] == "B47"
@@ -48,20 +71,10 @@ class TestEncapsulation:
         assert omi.params["PeriodEndUpdate"] == 202301020000
         assert omi.params["documentType"] == "B47"
 
-    def test_outages_parameter_initialization(self):
+    def test_outages_parameter_initialization(self, sample_outages):
         """Test that Outages class properly initializes parameters using base
         class methods."""
-        outages = Outages(
-            document_type="A77",
-            period_start=202301010000,
-            period_end=202301020000,
-            bidding_zone_domain="10YBE----------2",
-            business_type="A53",
-            registered_resource="10Y1001A1001A82H",  # Valid EIC code
-            doc_status="A05",
-            m_rid="test_mrid",
-            offset=100,
-        )
+        outages = sample_outages
 
         # Verify that parameters are set correctly
         assert outages.params["documentType"] == "A77"
@@ -91,8 +104,7 @@ class TestEncapsulation:
         with pytest.raises(ValueError, match="doc_status must be one of"):
             OMI(
                 control_area_domain="10YBE----------2",
-                period_start=202301010000,
-                period_end=202301020000,
+                **PERIOD,
                 doc_status="INVALID",  # type: ignore
             )
 
@@ -105,28 +117,13 @@ class TestEncapsulation:
                 control_area_domain="10YBE----------2",
             )
 
-    def test_encapsulation_no_direct_params_access(self):
+    @pytest.mark.parametrize("query", ["sample_omi", "sample_outages"])
+    def test_encapsulation_no_direct_params_access(self, query, request):
         """Test that both classes use proper encapsulation methods."""
-        # Test OMI
-        omi = OMI(
-            control_area_domain="10YBE----------2",
-            period_start=202301010000,
-            period_end=202301020000,
-        )
+        query = request.getfixturevalue(query)
 
         # The params dictionary should be properly initialized through Base
         # class methods
         # This verifies that we're not manually setting self.params = {...}
-        assert hasattr(omi, "params")
-        assert isinstance(omi.params, dict)
-
-        # Test Outages
-        outages = Outages(
-            document_type="A77",
-            bidding_zone_domain="10YBE----------2",
-        )
-
-        # The params dictionary should be properly initialized through Base
-        # class methods
-        assert hasattr(outages, "params")
-        assert isinstance(outages.params, dict)
+        assert hasattr(query, "params")
+        assert isinstance(query.params, dict)
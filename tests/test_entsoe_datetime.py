@@ -0,0 +1,30 @@
+"""Test module for verifying ENTSO-E datetime parsing and formatting."""
+
+from datetime import datetime
+
+import pytest
+
+from entsoe.utils.utils import format_entsoe_datetime, parse_entsoe_datetime
+
+
+class TestEntsoeDatetime:
+    """Test class for the YYYYMMDDHHMM datetime helpers."""
+
+    def test_parse(self):
+        """Test that every component is read from its digit position."""
+        assert parse_entsoe_datetime(202402291745) == datetime(2024, 2, 29, 17, 45)
+
+    def test_format(self):
+        """Test that a datetime is packed back into YYYYMMDDHHMM."""
+        assert format_entsoe_datetime(datetime(2023, 12, 31, 23, 5)) == 202312312305
+
+    def test_round_trip(self):
+        """Test that parsing and formatting are inverse operations."""
+        for value in (201501010000, 202001010000, 202310290230, 209912312359):
+            assert format_entsoe_datetime(parse_entsoe_datetime(value)) == value
+
+    @pytest.mark.parametrize("value", [202313010000, 202302300000, 202301012400])
+    def test_invalid_components_raise(self, value):
+        """Test that out-of-range components raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_entsoe_datetime(value)
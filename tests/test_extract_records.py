@@ -1,17 +1,58 @@
 # %%
 
+from pathlib import Path
+
+from httpx import Response
 import pytest
 
 from entsoe.config import get_config
 from entsoe.Market import EnergyPrices
+from entsoe.query.query_api import parse_response
 from entsoe.utils import extract_records
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def energy_prices():
+    """Parse the stored day-ahead price document for 10YNL----------L."""
+    content = (FIXTURES / "energy_prices_sample.xml").read_bytes()
+    return [parse_response(Response(status_code=200, content=content))]
+
+
+def assert_flat_records(records):
+    """Assert that records is a non-empty list of non-nested dicts."""
+    assert records is not None and len(records) > 0
+
+    # Assert that records is a list of dicts (without nested structures)
+    assert isinstance(records, list)
+    assert all(isinstance(record, dict) for record in records)
+
+    # Assert that each record is a non-nested dict.
+    assert all(
+        isinstance(value, (int, float, str, type(None)))
+        for record in records
+        for value in record.values()
+    )
+
+
+def test_extract_records(energy_prices):
+    result_records = extract_records(energy_prices)
+    assert_flat_records(result_records)
+    # Two days of hourly prices
+    assert len(result_records) == 48
+
+    result_records_ts = extract_records(energy_prices, domain="time_series")
+    assert_flat_records(result_records_ts)
+    assert len(result_records_ts) == 48
+
 
+@pytest.mark.integration
 @pytest.mark.skipif(
     get_config().security_token is None,
     reason="ENTSOE_API environment variable not set",
 )
-def test_extract_records():
+def test_extract_records_live():
     EIC = "10YNL----------L"
     period_start = 202001010000
     period_end = 202001030000
@@ -22,32 +63,5 @@ def test_extract_records():
         period_end=period_end,
     ).query_api()
 
-    result_records = extract_records(result)  # Assert that we got a result back
-    assert result_records is not None and len(result_records) > 0
-
-    # Assert that result_records is a list of dicts (without nested structures)
-    assert isinstance(result_records, list)
-    assert all(isinstance(record, dict) for record in result_records)
-
-    # Assert that each record is a non-nested dict.
-    assert all(
-        isinstance(value, (int, float, str, type(None)))
-        for record in result_records
-        for value in record.values()
-    )
-
-    result_records_ts = extract_records(
-        result, domain="time_series"
-    )  # Assert that we got a result back
-    assert result_records_ts is not None and len(result_records_ts) > 0
-
-    # Assert that result_records_ts is a list of dicts (without nested structures)
-    assert isinstance(result_records_ts, list)
-    assert all(isinstance(record, dict) for record in result_records_ts)
-
-    # Assert that each record is a non-nested dict.
-    assert all(
-        isinstance(value, (int, float, str, type(None)))
-        for record in result_records_ts
-        for value in record.values()
-    )
+    assert_flat_records(extract_records(result))
+    assert_flat_records(extract_records(result, domain="time_series"))
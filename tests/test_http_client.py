@@ -0,0 +1,60 @@
+"""Test module for verifying the shared HTTP client."""
+
+from httpx import Client, MockTransport, Response
+
+from entsoe import set_config
+from entsoe.query import query_api
+from entsoe.query.query_api import get_http_client, query_core
+
+SECURITY_TOKEN = "12345678-1234-1234-1234-123456789abc"
+
+
+class TestHttpClient:
+    """Test class for the HTTP client shared by all requests."""
+
+    def teardown_method(self):
+        """Restore the default configuration."""
+        set_config()
+
+    def test_client_is_shared(self):
+        """Test that the same client is returned for every request."""
+        assert get_http_client() is get_http_client()
+
+    def test_query_core_sends_requests_through_shared_client(self, monkeypatch):
+        """Test that query_core uses the shared client and adds the token."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return Response(status_code=200, content=b"<xml/>")
+
+        monkeypatch.setattr(
+            query_api, "_http_client", Client(transport=MockTransport(handler))
+        )
+        set_config(security_token=SECURITY_TOKEN)
+
+        query_core({"documentType": "A44"})
+        query_core({"documentType": "A65"})
+
+        assert len(requests) == 2
+        assert requests[0].url.params["documentType"] == "A44"
+        assert requests[1].url.params["securityToken"] == SECURITY_TOKEN
+
+    def test_configured_client_is_used(self):
+        """Test that a client passed to set_config replaces the shared client."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return Response(status_code=200, content=b"<xml/>")
+
+        client = Client(transport=MockTransport(handler))
+        set_config(security_token=SECURITY_TOKEN, http_client=client)
+
+        assert get_http_client() is client
+        query_core({"documentType": "A44"})
+
+        assert len(requests) == 1
+
+        set_config()
+        assert get_http_client() is not client
@@ -0,0 +1,78 @@
+"""Test module for verifying the global bound on concurrent requests."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from time import sleep
+
+from entsoe import set_config
+from entsoe.query.decorators import (
+    limit_concurrent_requests,
+    max_days_limit_ctx,
+    offset_increment_ctx,
+    pagination,
+    split_date_range,
+)
+
+
+class ConcurrencyProbe:
+    """Callable that records the peak number of simultaneous calls."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, params):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return [params]
+
+
+class TestLimitConcurrentRequests:
+    """Test class for limit_concurrent_requests decorator functionality."""
+
+    def teardown_method(self):
+        """Restore the default configuration."""
+        set_config()
+
+    def test_concurrent_calls_are_bounded_by_max_workers(self):
+        """Test that no more than max_workers calls run at the same time."""
+        set_config(max_workers=2)
+        probe = ConcurrencyProbe()
+        limited = limit_concurrent_requests(probe)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(limited, range(16)))
+
+        assert results == [[i] for i in range(16)]
+        assert probe.peak <= 2
+
+    def test_split_and_pagination_share_the_bound(self):
+        """Test that nested split and pagination workers respect one global bound."""
+        set_config(max_workers=3, pagination_concurrency=3, max_offset=500)
+        probe = ConcurrencyProbe()
+
+        @split_date_range
+        @pagination
+        def query(params):
+            return limit_concurrent_requests(probe)(params) * 100
+
+        max_days_token = max_days_limit_ctx.set(365)
+        offset_token = offset_increment_ctx.set(100)
+        try:
+            result = query({
+                "periodStart": 202001010000,
+                "periodEnd": 202301010000,
+                "offset": 0,
+            })
+        finally:
+            max_days_limit_ctx.reset(max_days_token)
+            offset_increment_ctx.reset(offset_token)
+
+        # Four chunks (2020 is a leap year) with six full pages each
+        assert len(result) == 4 * 6 * 100
+        assert probe.peak <= 3
@@ -1,47 +1,57 @@
 """Test module for verifying debug logging functionality."""
 
-from unittest.mock import patch
+import pytest
 
+from entsoe.config.config import logger
 from entsoe.utils.utils import check_date_range_limit, split_date_range
 
 
+@pytest.fixture
+def log_records():
+    """Capture (level, message) pairs logged by the package down to TRACE."""
+    records = []
+    handler_id = logger.add(
+        lambda message: records.append((
+            message.record["level"].name,
+            message.record["message"],
+        )),
+        level="TRACE",
+    )
+    yield records
+    logger.remove(handler_id)
+
+
+def check_one_day_range():
+    """Check a one-day range against the default limit."""
+    check_date_range_limit(202301010000, 202301020000, 365)
+
+
+def split_four_day_range():
+    """Split a four-day range with the default limit."""
+    split_date_range(202301010000, 202301050000)
+
+
 class TestLogging:
     """Test class for logging functionality."""
 
-    def test_utility_functions_have_trace_logging(self):
-        """Test that utility functions log TRACE messages for entry/exit."""
-        # Test check_date_range_limit
-        with patch("entsoe.utils.utils.logger") as mock_logger:
-            check_date_range_limit(202301010000, 202301020000, 365)
-            assert mock_logger.trace.called
-            # Verify that TRACE logging includes function entry/exit
-            trace_calls = [call[0][0] for call in mock_logger.trace.call_args_list]
-            assert any("check_date_range_limit: Enter" in arg for arg in trace_calls)
-            assert any("check_date_range_limit: Exit" in arg for arg in trace_calls)
-
-    def test_utility_functions_have_debug_logging(self):
-        """Test that utility functions log DEBUG messages for processing details."""
-        # Test check_date_range_limit
-        with patch("entsoe.utils.utils.logger") as mock_logger:
-            check_date_range_limit(202301010000, 202301020000, 365)
-            assert mock_logger.debug.called
-            # Verify that DEBUG logging mentions the processing details
-            debug_calls = [call[0][0] for call in mock_logger.debug.call_args_list]
-            assert any("Date range spans" in arg for arg in debug_calls)
-
-    def test_split_date_range_logging(self):
-        """Test that split_date_range logs TRACE and DEBUG messages."""
-        with patch("entsoe.utils.utils.logger") as mock_logger:
-            split_date_range(202301010000, 202301050000)
-            # Verify TRACE logging for entry/exit
-            assert mock_logger.trace.called
-            trace_calls = [call[0][0] for call in mock_logger.trace.call_args_list]
-            assert any("split_date_range: Enter" in arg for arg in trace_calls)
-            assert any("split_date_range: Exit" in arg for arg in trace_calls)
-            # Verify DEBUG logging for processing details
-            assert mock_logger.debug.called
-            debug_calls = [call[0][0] for call in mock_logger.debug.call_args_list]
-            # The function now returns a list of chunks, so logging changed
-            assert any(
-                "chunks" in arg.lower() or "split" in arg.lower() for arg in debug_calls
-            )
+    @pytest.mark.parametrize(
+        "call, level, text",
+        [
+            # Entry/exit of the utility functions are logged at TRACE
+            (check_one_day_range, "TRACE", "check_date_range_limit: Enter"),
+            (check_one_day_range, "TRACE", "check_date_range_limit: Exit"),
+            (split_four_day_range, "TRACE", "split_date_range: Enter"),
+            (split_four_day_range, "TRACE", "split_date_range: Exit"),
+            # Processing details are logged at DEBUG
+            (check_one_day_range, "DEBUG", "Date range spans 1 days"),
+            (split_four_day_range, "DEBUG", "Split into 1 chunks"),
+        ],
+    )
+    def test_utility_functions_log(self, log_records, call, level, text):
+        """Test that utility functions log the expected message at a level."""
+        call()
+
+        assert any(
+            record_level == level and text in message
+            for record_level, message in log_records
+        )
@@ -4,6 +4,7 @@ from entsoe.config import get_config
 from entsoe.Market import EnergyPrices
 
 
+@pytest.mark.integration
 @pytest.mark.skipif(
     get_config().security_token is None,
     reason="ENTSOE_API environment variable not set",
@@ -0,0 +1,46 @@
+"""Test module for verifying namespace extraction and model class lookup."""
+
+from httpx import Response
+import pytest
+
+from entsoe.utils.utils import extract_namespace_and_find_classes
+from entsoe.xml_models import V7AcknowledgementMarketDocument
+
+ACKNOWLEDGEMENT_NAMESPACE = (
+    "urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0"
+)
+
+
+def make_response(namespace: str) -> Response:
+    """Build a Response with a root element in the given namespace."""
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<Acknowledgement_MarketDocument xmlns="{namespace}">'
+        "<mRID>1</mRID></Acknowledgement_MarketDocument>"
+    )
+    return Response(status_code=200, content=xml.encode())
+
+
+class TestExtractNamespaceAndFindClasses:
+    """Test class for extract_namespace_and_find_classes functionality."""
+
+    def test_class_is_resolved_from_root_namespace(self):
+        """Test that the model class is looked up by the root element namespace."""
+        namespace, cls = extract_namespace_and_find_classes(
+            make_response(ACKNOWLEDGEMENT_NAMESPACE)
+        )
+
+        assert namespace == ACKNOWLEDGEMENT_NAMESPACE
+        assert cls is V7AcknowledgementMarketDocument
+
+    def test_unknown_namespace_raises(self):
+        """Test that a namespace without a model class raises ValueError."""
+        with pytest.raises(ValueError, match="No classes found"):
+            extract_namespace_and_find_classes(make_response("urn:unknown"))
+
+    def test_missing_namespace_raises(self):
+        """Test that a root element without a namespace raises ValueError."""
+        response = Response(status_code=200, content=b"<root><child/></root>")
+
+        with pytest.raises(ValueError, match="No default namespace"):
+            extract_namespace_and_find_classes(response)
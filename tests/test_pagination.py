@@ -1,21 +1,52 @@
 """Tests for pagination with different offset increments."""
 
+from contextlib import contextmanager
+import threading
+from time import sleep
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from entsoe import set_config
 from entsoe.Base.Balancing import Balancing
+from entsoe.Base.Base import Base
 from entsoe.Base.Market import Market
 from entsoe.Base.Outages import Outages
 from entsoe.query import decorators
 from entsoe.query.decorators import pagination
+from entsoe.query.query_api import query_api
+
+
+@contextmanager
+def query_context(offset_increment, max_days_limit=None):
+    """Set the offset increment, and optionally the max days limit, of a query."""
+    offset_token = decorators.offset_increment_ctx.set(offset_increment)
+    max_days_token = (
+        decorators.max_days_limit_ctx.set(max_days_limit)
+        if max_days_limit is not None
+        else None
+    )
+    try:
+        yield
+    finally:
+        decorators.offset_increment_ctx.reset(offset_token)
+        if max_days_token is not None:
+            decorators.max_days_limit_ctx.reset(max_days_token)
 
 
 class TestPaginationOffsetIncrement:
     """Test pagination with different offset increments for different groups."""
 
+    def setup_method(self):
+        """Fetch pages one at a time so call order is deterministic."""
+        set_config(pagination_concurrency=1)
+
+    def teardown_method(self):
+        """Restore the default configuration."""
+        set_config()
+
     def test_base_class_has_offset_increment(self):
         """Test that Base class has offset_increment attribute with default value."""
-        from entsoe.Base.Base import Base
-
         assert hasattr(Base, "offset_increment")
         assert Base.offset_increment == 100
 
@@ -55,18 +86,17 @@ class TestPaginationOffsetIncrement:
         mock_func.side_effect = side_effect
 
         # Call the decorated function with offset_increment=100
-        token = decorators.offset_increment_ctx.set(100)
-        try:
+        with query_context(100):
             decorated_func(params)
-        finally:
-            decorators.offset_increment_ctx.reset(token)
 
         # Verify the function was called with offset=0
         assert (
             mock_func.call_count == 2
         )  # First call returns data, second returns empty
-        # Verify the offset was set correctly in the params
-        assert params["offset"] == 100  # Last offset value
+        # Verify the offset was set correctly for the last page
+        assert mock_func.call_args_list[-1][0][0]["offset"] == 100
+        # The caller's params are left untouched
+        assert params["offset"] == 0
 
     def test_pagination_decorator_uses_offset_increment_200(self):
         """Test pagination decorator with offset_increment=200 (Outages)."""
@@ -89,11 +119,8 @@ class TestPaginationOffsetIncrement:
         mock_func.side_effect = side_effect
 
         # Call the decorated function with offset_increment=200
-        token = decorators.offset_increment_ctx.set(200)
-        try:
+        with query_context(200):
             decorated_func(params)
-        finally:
-            decorators.offset_increment_ctx.reset(token)
 
         # Verify the function was called with increasing offsets
         assert mock_func.call_count == 3  # Two calls with data, one empty
@@ -108,11 +135,8 @@ class TestPaginationOffsetIncrement:
         # Params without offset
         params = {"documentType": "A25"}
 
-        token = decorators.offset_increment_ctx.set(100)
-        try:
+        with query_context(100):
             decorated_func(params)
-        finally:
-            decorators.offset_increment_ctx.reset(token)
 
         # Should call the function once without pagination
         assert mock_func.call_count == 1
@@ -135,18 +159,8 @@ class TestPaginationOffsetIncrement:
         with patch("entsoe.query.query_api.query_and_parse") as mock_query_parse:
             mock_query_parse.return_value = []
 
-            # Since we're patching deeper, we can directly verify the parameters
-            # passed to the actual query_api function
-            from entsoe.query.query_api import query_api
-
-            # Set context variables directly
-            token_max_days = decorators.max_days_limit_ctx.set(outages.max_days_limit)
-            token_offset = decorators.offset_increment_ctx.set(outages.offset_increment)
-            try:
+            with query_context(outages.offset_increment, outages.max_days_limit):
                 query_api(outages.params)
-            finally:
-                decorators.max_days_limit_ctx.reset(token_max_days)
-                decorators.offset_increment_ctx.reset(token_offset)
 
             # The function should have been called
             assert mock_query_parse.called
@@ -169,60 +183,176 @@ class TestPaginationOffsetIncrement:
         with patch("entsoe.query.query_api.query_and_parse") as mock_query_parse:
             mock_query_parse.return_value = []
 
-            # Since we're patching deeper, we can directly verify the parameters
-            # passed to the actual query_api function
-            from entsoe.query.query_api import query_api
-
-            # Set context variables directly
-            token_max_days = decorators.max_days_limit_ctx.set(market.max_days_limit)
-            token_offset = decorators.offset_increment_ctx.set(market.offset_increment)
-            try:
+            with query_context(market.offset_increment, market.max_days_limit):
                 query_api(market.params)
-            finally:
-                decorators.max_days_limit_ctx.reset(token_max_days)
-                decorators.offset_increment_ctx.reset(token_offset)
 
             # The function should have been called
             assert mock_query_parse.called
 
-    def test_pagination_respects_max_offset_with_increment_100(self):
-        """Test that pagination respects max offset of 4800 with increment 100."""
-        mock_func = MagicMock(return_value=[{"data": "test"}])
+    @pytest.mark.parametrize(
+        "offset_increment, expected_calls",
+        [
+            (100, 49),  # Market/Balancing: 0, 100, 200, ..., 4700, 4800
+            (200, 25),  # Outages: 0, 200, 400, ..., 4600, 4800
+        ],
+    )
+    def test_pagination_respects_max_offset(self, offset_increment, expected_calls):
+        """Test that pagination respects max offset of 4800 for each increment."""
+        offsets_used = []
+
+        # Always return data (to test we stop at 4800)
+        def query(p, *args, **kwargs):
+            offsets_used.append(p["offset"])
+            return [{"data": "test"}]
+
+        decorated_func = pagination(query)
+
+        with query_context(offset_increment):
+            decorated_func({"offset": 0, "documentType": "A25"})
+
+        assert len(offsets_used) == expected_calls
+        # Last call should have offset 4800
+        assert offsets_used[-1] == 4800
+
+    def test_pagination_continues_after_single_document_pages(self):
+        """Test that pages parsing to a single document do not end pagination;
+        only an empty page does."""
+        offsets_used = []
+
+        def side_effect(p, *args, **kwargs):
+            offsets_used.append(p["offset"])
+            if p["offset"] <= 300:
+                return [{"data": f"result_{p['offset']}"}]
+            return []
+
+        decorated_func = pagination(MagicMock(side_effect=side_effect))
+
+        with query_context(100):
+            result = decorated_func({"offset": 0, "documentType": "A25"})
+
+        assert offsets_used == [0, 100, 200, 300, 400]
+        assert result == [{"data": f"result_{offset}"} for offset in range(0, 400, 100)]
+
+    def test_pagination_fetches_pages_ahead_in_parallel(self):
+        """Test that up to pagination_concurrency pages are requested ahead and
+        merged in offset order, ignoring speculative pages past the last one."""
+        set_config(pagination_concurrency=4)
+
+        def side_effect(p, *args, **kwargs):
+            if p["offset"] <= 500:
+                return [p["offset"]] * 100
+            return []
+
+        mock_func = MagicMock(side_effect=side_effect)
         decorated_func = pagination(mock_func)
 
         params = {"offset": 0, "documentType": "A25"}
 
-        # Mock to always return data (to test we stop at 4800)
-        mock_func.return_value = [{"data": "test"}]
+        with query_context(100):
+            result = decorated_func(params)
 
-        token = decorators.offset_increment_ctx.set(100)
-        try:
-            decorated_func(params)
-        finally:
-            decorators.offset_increment_ctx.reset(token)
+        # Pages up to the empty one were requested; at most three pages past it
+        # were in flight, and not-yet-started ones may have been cancelled
+        offsets_used = {call[0][0]["offset"] for call in mock_func.call_args_list}
+        assert {0, 100, 200, 300, 400, 500, 600} <= offsets_used
+        assert max(offsets_used) <= 900
+        # Only pages before the empty page are merged, in order
+        assert result == [offset for offset in range(0, 600, 100) for _ in range(100)]
 
-        # Should have been called 49 times (0, 100, 200, ..., 4700, 4800)
-        assert mock_func.call_count == 49
-        # Last call should have offset 4800
-        assert mock_func.call_args_list[-1][0][0]["offset"] == 4800
+    def test_pagination_default_requests_no_speculative_pages(self):
+        """Test that by default no page past the empty one is requested."""
+        set_config()
+        offsets_used = []
+
+        def query(p, *args, **kwargs):
+            offsets_used.append(p["offset"])
+            return [{"data": "test"}] if p["offset"] == 0 else []
+
+        with query_context(100):
+            result = pagination(query)({"offset": 0, "documentType": "A25"})
+
+        assert result == [{"data": "test"}]
+        assert offsets_used == [0, 100]
+
+    def test_pagination_default_fetches_pages_inline(self):
+        """Test that by default pages are fetched on the calling thread, without
+        creating a thread pool."""
+        set_config()
+        threads_used = []
+
+        def query(p, *args, **kwargs):
+            threads_used.append(threading.current_thread())
+            return [{"data": "test"}] if p["offset"] < 200 else []
+
+        with (
+            patch.object(decorators, "ContextPropagatingThreadPoolExecutor") as pool,
+            query_context(100),
+        ):
+            result = pagination(query)({"offset": 0, "documentType": "A25"})
+
+        assert result == [{"data": "test"}] * 2
+        assert threads_used == [threading.current_thread()] * 3
+        pool.assert_not_called()
+
+    def test_pagination_requests_first_page_alone(self):
+        """Test that parallel paging requests nothing ahead of the first page when
+        it turns out to be the last one."""
+        set_config(pagination_concurrency=4)
+        mock_func = MagicMock(return_value=[])
+
+        with query_context(100):
+            result = pagination(mock_func)({"offset": 0, "documentType": "A25"})
+
+        assert result == []
+        mock_func.assert_called_once_with({"offset": 0, "documentType": "A25"})
+
+    def test_pagination_respects_configured_max_offset(self):
+        """Test that the highest requested offset follows the max_offset setting."""
+        set_config(pagination_concurrency=1, max_offset=300)
 
-    def test_pagination_respects_max_offset_with_increment_200(self):
-        """Test that pagination respects max offset of 4800 with increment 200."""
         mock_func = MagicMock(return_value=[{"data": "test"}])
         decorated_func = pagination(mock_func)
 
-        params = {"offset": 0, "documentType": "A77"}
+        with query_context(100):
+            decorated_func({"offset": 0, "documentType": "A25"})
 
-        # Mock to always return data (to test we stop at 4800)
-        mock_func.return_value = [{"data": "test"}]
+        offsets_used = [call[0][0]["offset"] for call in mock_func.call_args_list]
+        assert offsets_used == [0, 100, 200, 300]
 
-        token = decorators.offset_increment_ctx.set(200)
-        try:
-            decorated_func(params)
-        finally:
-            decorators.offset_increment_ctx.reset(token)
+    def test_pagination_single_page_when_increment_exceeds_max_offset(self):
+        """Test that only offset 0 is requested when the increment exceeds max_offset."""
+        set_config(pagination_concurrency=4, max_offset=4800)
 
-        # Should have been called 25 times (0, 200, 400, ..., 4600, 4800)
-        assert mock_func.call_count == 25
-        # Last call should have offset 4800
-        assert mock_func.call_args_list[-1][0][0]["offset"] == 4800
+        mock_func = MagicMock(return_value=None)
+        decorated_func = pagination(mock_func)
+
+        with query_context(5000):
+            result = decorated_func({"offset": 100, "documentType": "A25"})
+
+        assert result == []
+        mock_func.assert_called_once_with({"offset": 0, "documentType": "A25"})
+
+    def test_pagination_limits_pages_in_flight(self):
+        """Test that no more than pagination_concurrency pages run at once."""
+        set_config(pagination_concurrency=2, max_offset=900)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def side_effect(p, *args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            sleep(0.01)
+            with lock:
+                running -= 1
+            return [p["offset"]] * 100
+
+        decorated_func = pagination(MagicMock(side_effect=side_effect))
+
+        with query_context(100):
+            result = decorated_func({"offset": 0, "documentType": "A25"})
+
+        assert len(result) == 1000
+        assert peak <= 2
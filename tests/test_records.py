@@ -0,0 +1,124 @@
+"""Test module for verifying record extraction from parsed models."""
+
+from httpx import Response
+import pytest
+
+from entsoe.query.query_api import parse_response
+from entsoe.utils import extract_records
+from entsoe.utils.records import normalize_to_records
+
+PUBLICATION_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument
+    xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+    <mRID>6a5f7f9b2d3c4e1fa0b1c2d3e4f5a6b7</mRID>
+    <revisionNumber>1</revisionNumber>
+    <type>A44</type>
+    <sender_MarketParticipant.mRID codingScheme="A01">10X1001A1001A450</sender_MarketParticipant.mRID>
+    <sender_MarketParticipant.marketRole.type>A32</sender_MarketParticipant.marketRole.type>
+    <receiver_MarketParticipant.mRID codingScheme="A01">10X1001A1001A450</receiver_MarketParticipant.mRID>
+    <receiver_MarketParticipant.marketRole.type>A33</receiver_MarketParticipant.marketRole.type>
+    <createdDateTime>2024-08-20T10:00:00Z</createdDateTime>
+    <period.timeInterval>
+        <start>2024-08-19T22:00Z</start>
+        <end>2024-08-20T22:00Z</end>
+    </period.timeInterval>
+    <TimeSeries>
+        <mRID>1</mRID>
+        <businessType>A62</businessType>
+        <in_Domain.mRID codingScheme="A01">10YNL----------L</in_Domain.mRID>
+        <out_Domain.mRID codingScheme="A01">10YNL----------L</out_Domain.mRID>
+        <currency_Unit.name>EUR</currency_Unit.name>
+        <curveType>A03</curveType>
+        <Period>
+            <timeInterval>
+                <start>2024-08-19T22:00Z</start>
+                <end>2024-08-20T22:00Z</end>
+            </timeInterval>
+            <resolution>PT60M</resolution>
+            <Point><position>1</position><price.amount>84.12</price.amount></Point>
+            <Point><position>2</position><price.amount>79.50</price.amount></Point>
+        </Period>
+    </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+
+@pytest.fixture
+def publication():
+    """Parse the sample publication document into its model."""
+    return parse_response(Response(status_code=200, content=PUBLICATION_XML))
+
+
+class TestNormalizeToRecords:
+    """Test class for normalize_to_records functionality."""
+
+    def test_nested_dicts_are_flattened(self):
+        """Test that nested dictionaries are joined with dotted keys."""
+        data = {"nested": {"level1": {"level2": "value"}}}
+
+        assert normalize_to_records(data) == [{"nested.level1.level2": "value"}]
+
+    def test_lists_are_expanded_into_records(self):
+        """Test that list elements become separate records sharing parent fields."""
+        data = {"user": "john", "orders": [{"id": 1}, {"id": 2}]}
+
+        assert normalize_to_records(data) == [
+            {"user": "john", "orders.id": 1},
+            {"user": "john", "orders.id": 2},
+        ]
+
+    def test_ignored_fields_are_removed(self):
+        """Test that ignored fields are dropped at every level."""
+        data = {"m_rid": "123", "user": "john", "orders": [{"id": 1, "m_rid": "x"}]}
+
+        assert normalize_to_records(data, ignore_fields=["m_rid", "orders.m_rid"]) == [
+            {"user": "john", "orders.id": 1}
+        ]
+
+    def test_ignored_scalar_list_is_removed(self):
+        """Test that an ignored list of scalars still yields one record per item."""
+        data = {"user": "john", "tags": ["a", "b"]}
+
+        assert normalize_to_records(data, ignore_fields=["tags"]) == [
+            {"user": "john"},
+            {"user": "john"},
+        ]
+
+
+class TestExtractRecords:
+    """Test class for extract_records functionality."""
+
+    def test_one_record_per_point(self, publication):
+        """Test that each point becomes a record with the document fields."""
+        records = extract_records(publication)
+
+        assert len(records) == 2
+        assert [r["time_series.period.point.price_amount"] for r in records] == [
+            "84.12",
+            "79.50",
+        ]
+        assert all(r["type_value"] == "A44" for r in records)
+        assert all("m_rid" not in r and "time_series.m_rid" not in r for r in records)
+
+    def test_domain_limits_records_to_domain(self, publication):
+        """Test that a domain extracts only the fields below that key."""
+        records = extract_records(publication, domain="time_series")
+
+        assert len(records) == 2
+        assert records[0]["period.resolution"] == "PT60M"
+        assert "type_value" not in records[0]
+
+    def test_unknown_domain_raises(self, publication):
+        """Test that an unknown domain raises KeyError listing available keys."""
+        with pytest.raises(KeyError, match="time_series"):
+            extract_records(publication, domain="unknown")
+
+    def test_duplicates_are_removed(self, publication):
+        """Test that identical records from repeated models are deduplicated."""
+        assert len(extract_records([publication, publication])) == 2
+        assert len(extract_records([publication] * 2, deduplicate=False)) == 4
+
+    def test_non_model_list_item_raises(self, publication):
+        """Test that a list item which is not a BaseModel raises TypeError."""
+        with pytest.raises(TypeError, match="BaseModel instances"):
+            extract_records([publication, {"type": "A44"}])
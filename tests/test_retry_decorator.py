@@ -1,12 +1,20 @@
 """Test module for verifying retry decorator functionality."""
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import patch
 
 import httpx
 import pytest
 
 from entsoe import set_config
-from entsoe.query.decorators import retry
+from entsoe.config.config import MAX_RETRY_DELAY
+from entsoe.query.decorators import (
+    AcknowledgementDocumentError,
+    CircuitOpenError,
+    check_service_unavailable,
+    retry,
+)
 
 
 class TestRetryDecorator:
@@ -16,6 +24,10 @@ class TestRetryDecorator:
         """Set up test configuration before each test."""
         set_config(retries=3, retry_delay=lambda attempt: 1)
 
+    def teardown_method(self):
+        """Restore the default configuration."""
+        set_config()
+
     def test_retry_decorator_success_on_first_attempt(self):
         """Test that retry decorator works correctly when function succeeds
         on first attempt."""
@@ -27,7 +39,7 @@ class TestRetryDecorator:
         result = successful_function("arg1", kwarg="value")
         assert result == "success"
 
-    def test_retry_decorator_success_after_failures(self):
+    def test_retry_decorator_success_after_failures(self, fake_sleep):
         """Test that retry decorator retries and eventually succeeds."""
         call_count = 0
 
@@ -36,19 +48,18 @@ class TestRetryDecorator:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                raise httpx.RequestError("Connection failed")
+                raise httpx.ConnectError("Connection failed")
             return f"success after {call_count} attempts"
 
-        with patch("entsoe.query.decorators.sleep") as mock_sleep:
-            result = function_that_fails_twice("arg1", kwarg="value")
+        result = function_that_fails_twice("arg1", kwarg="value")
 
         assert result == "success after 3 attempts"
         assert call_count == 3
-        # Verify sleep was called twice (for the first two failed attempts)
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_called_with(1)  # Using retry_delay from test setup
+        # Slept after each of the first two failed attempts, using the
+        # retry_delay from test setup
+        assert fake_sleep == [1, 1]
 
-    def test_retry_decorator_exhausts_all_attempts(self):
+    def test_retry_decorator_exhausts_all_attempts(self, fake_sleep):
         """Test that retry decorator raises exception after all attempts
         are exhausted."""
         call_count = 0
@@ -57,16 +68,15 @@ class TestRetryDecorator:
         def always_failing_function(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            raise httpx.RequestError("Connection always fails")
+            raise httpx.ConnectError("Connection always fails")
 
-        with patch("entsoe.query.decorators.sleep") as mock_sleep:
-            with pytest.raises(httpx.RequestError, match="Connection always fails"):
-                always_failing_function("arg1", kwarg="value")
+        with pytest.raises(httpx.RequestError, match="Connection always fails"):
+            always_failing_function("arg1", kwarg="value")
 
         # Should have been called 3 times (default retry_count)
         assert call_count == 3
         # Should have slept twice (after first two failures, not after the last)
-        assert mock_sleep.call_count == 2
+        assert len(fake_sleep) == 2
 
     def test_retry_decorator_with_non_httpx_exception(self):
         """Test that retry decorator doesn't retry non-httpx exceptions."""
@@ -118,7 +128,7 @@ class TestRetryDecorator:
         result = function_with_timeout(timeout=30)
         assert result == 30
 
-    def test_retry_decorator_logs_correctly(self):
+    def test_retry_decorator_logs_correctly(self, fake_sleep):
         """Test that retry decorator logs warning messages correctly."""
         call_count = 0
 
@@ -127,86 +137,105 @@ class TestRetryDecorator:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise httpx.RequestError("First failure")
+                raise httpx.ConnectError("First failure")
             return "success"
 
-        with patch("entsoe.query.decorators.sleep"):
-            with patch("entsoe.query.decorators.logger") as mock_logger:
-                result = function_that_fails_once()
+        with patch("entsoe.query.decorators.logger") as mock_logger:
+            result = function_that_fails_once()
 
         assert result == "success"
         assert call_count == 2
 
         # Verify warning was logged
         mock_logger.warning.assert_called_once()
-        warning_call = mock_logger.warning.call_args[0][0]
+        # The message is formatted by the logger from deferred arguments
+        message, *args = mock_logger.warning.call_args.args
+        warning_call = message.format(*args)
         assert "Attempt 1/3 failed" in warning_call
         assert "First failure" in warning_call
         assert "Retrying in 1s" in warning_call
 
-    def test_retry_decorator_logs_final_error(self):
+    def test_retry_decorator_logs_final_error(self, fake_sleep):
         """Test that retry decorator logs error when all attempts fail."""
 
         @retry
         def always_failing_function():
-            raise httpx.RequestError("Always fails")
+            raise httpx.ConnectError("Always fails")
 
-        with patch("entsoe.query.decorators.sleep"):
-            with patch("entsoe.query.decorators.logger") as mock_logger:
-                with pytest.raises(httpx.RequestError):
-                    always_failing_function()
+        with patch("entsoe.query.decorators.logger") as mock_logger:
+            with pytest.raises(httpx.RequestError):
+                always_failing_function()
 
         # Verify error was logged
-        mock_logger.error.assert_called_once_with(
-            'All 3 retry attempts failed. You may use entsoe.config.set_config(log_level="DEBUG") for more details.'
+        mock_logger.error.assert_called_once()
+        message, *args = mock_logger.error.call_args.args
+        assert (
+            message.format(*args)
+            == 'All 3 retry attempts failed. You may use entsoe.config.set_config(log_level="DEBUG") for more details.'
         )
 
-    def test_retry_decorator_different_httpx_errors(self):
-        """Test that retry decorator handles different types of httpx errors."""
-        error_types = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             httpx.ConnectError("Connection failed"),
             httpx.TimeoutException("Request timed out"),
             httpx.NetworkError("Network unreachable"),
-        ]
+        ],
+    )
+    def test_retry_decorator_different_httpx_errors(self, fake_sleep, error):
+        """Test that retry decorator handles different types of httpx errors."""
+        call_count = 0
 
-        for error in error_types:
-            call_count = 0
+        @retry
+        def function_with_specific_error():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise error
+            return "success"
 
-            @retry
-            def function_with_specific_error():
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    raise error
-                return "success"
+        result = function_with_specific_error()
 
-            with patch("entsoe.query.decorators.sleep"):
-                result = function_with_specific_error()
+        assert result == "success"
+        assert call_count == 2
 
-            assert result == "success"
-            assert call_count == 2
+    def test_retry_decorator_does_not_retry_non_transient_errors(self, fake_sleep):
+        """Test that request errors other than transport errors are raised
+        immediately without retrying."""
+        call_count = 0
+
+        @retry
+        def function_with_decoding_error():
+            nonlocal call_count
+            call_count += 1
+            raise httpx.DecodingError("Malformed response body")
+
+        with pytest.raises(httpx.DecodingError):
+            function_with_decoding_error()
+
+        assert call_count == 1
+        assert fake_sleep == []
 
     def test_retry_decorator_runtime_error_on_unknown_failure(self):
         """Test that retry decorator raises RuntimeError when no exception
         is captured."""
-        # This is an edge case test for the RuntimeError fallback
-        # It's difficult to trigger naturally, so we'll mock the behavior
+        # With no attempts configured the loop ends without an exception
+        set_config(retries=0)
+        calls = []
 
         @retry
-        def function_that_somehow_fails_without_exception():
-            # This scenario is unlikely in real code but tests the fallback
+        def function_never_called(*args, **kwargs):
+            calls.append(args)
             return "success"
 
-        # We can't easily test the RuntimeError fallback without modifying
-        # the decorator internals, so we'll verify the logic exists
-        # by checking the source code structure
-        import inspect
+        with pytest.raises(
+            RuntimeError, match="All retry attempts failed with unknown error"
+        ):
+            function_never_called()
 
-        source = inspect.getsource(retry)
-        assert "RuntimeError" in source
-        assert "All retry attempts failed with unknown error" in source
+        assert calls == []
 
-    def test_default_exponential_backoff(self):
+    def test_default_exponential_backoff(self, fake_sleep):
         """Test that default exponential backoff function works correctly."""
         set_config(retries=3)
 
@@ -217,20 +246,20 @@ class TestRetryDecorator:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                raise httpx.RequestError("Connection failed")
+                raise httpx.ConnectError("Connection failed")
             return "success"
 
-        with patch("entsoe.query.decorators.sleep") as mock_sleep:
-            result = function_that_fails_twice()
+        result = function_that_fails_twice()
 
         assert result == "success"
         assert call_count == 3
-        # Verify exponential backoff: first retry waits 2^0=1, second retry waits 2^1=2
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_any_call(1)  # 2^0 = 1
-        mock_sleep.assert_any_call(2)  # 2^1 = 2
+        # Verify full-jitter exponential backoff: first retry waits up to 2^0,
+        # second retry waits up to 2^1
+        first_delay, second_delay = fake_sleep
+        assert 0 <= first_delay <= 1
+        assert 0 <= second_delay <= 2
 
-    def test_custom_retry_delay_function(self):
+    def test_custom_retry_delay_function(self, fake_sleep):
         """Test that custom retry delay functions work correctly."""
 
         def linear_backoff(attempt):
@@ -245,20 +274,17 @@ class TestRetryDecorator:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                raise httpx.RequestError("Connection failed")
+                raise httpx.ConnectError("Connection failed")
             return "success"
 
-        with patch("entsoe.query.decorators.sleep") as mock_sleep:
-            result = function_that_fails_twice()
+        result = function_that_fails_twice()
 
         assert result == "success"
         assert call_count == 3
         # Verify custom backoff: first retry waits 5, second retry waits 10
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_any_call(5)  # (0 + 1) * 5 = 5
-        mock_sleep.assert_any_call(10)  # (1 + 1) * 5 = 10
+        assert fake_sleep == [5, 10]  # (0 + 1) * 5, (1 + 1) * 5
 
-    def test_integer_retry_delay(self):
+    def test_integer_retry_delay(self, fake_sleep):
         """Test that integer retry_delay values work correctly."""
         set_config(retries=3, retry_delay=7)  # Integer delay
 
@@ -269,15 +295,243 @@ class TestRetryDecorator:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                raise httpx.RequestError("Connection failed")
+                raise httpx.ConnectError("Connection failed")
             return "success"
 
-        with patch("entsoe.query.decorators.sleep") as mock_sleep:
-            result = function_that_fails_twice()
+        result = function_that_fails_twice()
 
         assert result == "success"
         assert call_count == 3
         # Verify constant backoff: both retries wait 7 seconds
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_any_call(7)  # First retry
-        mock_sleep.assert_any_call(7)  # Second retry
+        assert fake_sleep == [7, 7]
+
+    @staticmethod
+    def unavailable_function(responses):
+        """Return a retried request function answering with the given responses."""
+        calls = iter(responses)
+
+        @retry
+        @check_service_unavailable
+        def request_function(*args, **kwargs):
+            return next(calls)
+
+        return request_function
+
+    @pytest.mark.parametrize("status_code", [503, 429])
+    def test_retry_honors_retry_after_seconds(self, fake_sleep, status_code):
+        """Test that a Retry-After header in seconds sets the wait."""
+        function = self.unavailable_function([
+            httpx.Response(status_code, headers={"Retry-After": "7"}),
+            httpx.Response(200, content=b"<xml/>"),
+        ])
+
+        response = function()
+
+        assert response.status_code == 200
+        assert fake_sleep == [7.0]
+
+    def test_retry_honors_retry_after_date(self, fake_sleep):
+        """Test that a Retry-After header with an HTTP date sets the wait."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        function = self.unavailable_function([
+            httpx.Response(503, headers={"Retry-After": format_datetime(retry_at)}),
+            httpx.Response(200, content=b"<xml/>"),
+        ])
+
+        function()
+
+        (delay,) = fake_sleep
+        assert 55 <= delay <= 60
+
+    @pytest.mark.parametrize(
+        "retry_after",
+        [
+            "3600",
+            format_datetime(datetime.now(timezone.utc) + timedelta(days=1)),
+        ],
+    )
+    def test_retry_after_is_capped(self, fake_sleep, retry_after):
+        """Test that a very long Retry-After wait is capped at MAX_RETRY_DELAY."""
+        function = self.unavailable_function([
+            httpx.Response(503, headers={"Retry-After": retry_after}),
+            httpx.Response(200, content=b"<xml/>"),
+        ])
+
+        function()
+
+        assert fake_sleep == [MAX_RETRY_DELAY]
+
+    @pytest.mark.parametrize("retry_after", ["0", "soon", None])
+    def test_retry_after_never_shortens_backoff(self, fake_sleep, retry_after):
+        """Test that short, invalid or missing Retry-After headers keep the
+        configured delay."""
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        function = self.unavailable_function([
+            httpx.Response(503, headers=headers),
+            httpx.Response(200, content=b"<xml/>"),
+        ])
+
+        function()
+
+        assert fake_sleep == [1]
+
+
+class TestCircuitBreaker:
+    """Test class for the circuit breaker of the retry decorator."""
+
+    def setup_method(self):
+        """Set up a configuration whose circuit opens after five failures."""
+        set_config(
+            retries=3,
+            retry_delay=lambda attempt: 1,
+            circuit_breaker_threshold=5,
+            circuit_breaker_reset=30,
+        )
+
+    def teardown_method(self):
+        """Restore the default configuration."""
+        set_config()
+
+    @staticmethod
+    def failing_function(calls):
+        """Return a retried function that records its calls and always fails."""
+
+        @retry
+        def always_failing_function(*args, **kwargs):
+            calls.append(args)
+            raise httpx.ConnectError("Connection always fails")
+
+        return always_failing_function
+
+    def test_circuit_opens_after_threshold(self, fake_sleep):
+        """Test that requests fail fast without sleeping once the circuit is open."""
+        calls = []
+        function = self.failing_function(calls)
+
+        # Three failures exhaust the retries of the first call
+        with pytest.raises(httpx.ConnectError):
+            function()
+        # The fifth consecutive failure opens the circuit mid-retries
+        with pytest.raises(CircuitOpenError):
+            function()
+        assert len(calls) == 5
+        assert len(fake_sleep) == 3
+
+        # The next call raises before making a request or sleeping
+        with pytest.raises(CircuitOpenError):
+            function()
+
+        assert len(calls) == 5
+        assert len(fake_sleep) == 3
+
+    def test_circuit_half_open_probe(self, fake_sleep):
+        """Test that a single probe is let through after the reset timeout and a
+        success closes the circuit."""
+        calls = []
+        function = self.failing_function(calls)
+        healthy = False
+
+        @retry
+        def recovering_function(*args, **kwargs):
+            calls.append(args)
+            if not healthy:
+                raise httpx.ConnectError("Connection failed")
+            return "success"
+
+        with patch("entsoe.query.decorators.monotonic", return_value=100.0) as clock:
+            for _ in range(2):
+                with pytest.raises((httpx.ConnectError, CircuitOpenError)):
+                    function()
+            assert len(calls) == 5
+
+            # Still open before the reset timeout
+            clock.return_value = 129.0
+            with pytest.raises(CircuitOpenError):
+                recovering_function()
+            assert len(calls) == 5
+
+            # A failed probe opens the circuit again without retrying
+            clock.return_value = 131.0
+            with pytest.raises(CircuitOpenError):
+                recovering_function()
+            assert len(calls) == 6
+
+            # A successful probe closes the circuit
+            clock.return_value = 162.0
+            healthy = True
+            assert recovering_function() == "success"
+            assert recovering_function() == "success"
+            assert len(calls) == 8
+
+    def test_circuit_breaker_disabled_by_default(self, fake_sleep):
+        """Test that the circuit breaker is disabled unless a threshold is set."""
+        set_config(retries=3, retry_delay=lambda attempt: 1)
+        calls = []
+        function = self.failing_function(calls)
+
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                function()
+
+        assert len(calls) == 9
+
+    def test_non_transient_response_closes_circuit(self, fake_sleep):
+        """Test that an answered request resets the count of failures."""
+        calls = []
+        function = self.failing_function(calls)
+
+        @retry
+        def rejected_function(*args, **kwargs):
+            raise AcknowledgementDocumentError("Invalid request")
+
+        with pytest.raises(httpx.ConnectError):
+            function()
+        with pytest.raises(AcknowledgementDocumentError):
+            rejected_function()
+        with pytest.raises(httpx.ConnectError):
+            function()
+
+        assert len(calls) == 6
+
+    def test_local_error_does_not_close_circuit(self, fake_sleep):
+        """Test that an error raised without an answer of the API keeps the count
+        of failures."""
+        calls = []
+        function = self.failing_function(calls)
+
+        @retry
+        def invalid_function(*args, **kwargs):
+            raise ValueError("Invalid security token")
+
+        with pytest.raises(httpx.ConnectError):
+            function()
+        with pytest.raises(ValueError):
+            invalid_function()
+        # The fifth consecutive failure still opens the circuit
+        with pytest.raises(CircuitOpenError):
+            function()
+
+        assert len(calls) == 5
+
+    def test_local_error_releases_probe(self, fake_sleep):
+        """Test that a probe failing locally lets the next probe through."""
+        calls = []
+        function = self.failing_function(calls)
+
+        @retry
+        def invalid_function(*args, **kwargs):
+            raise ValueError("Invalid security token")
+
+        with patch("entsoe.query.decorators.monotonic", return_value=100.0) as clock:
+            for _ in range(2):
+                with pytest.raises((httpx.ConnectError, CircuitOpenError)):
+                    function()
+
+            clock.return_value = 131.0
+            with pytest.raises(ValueError):
+                invalid_function()
+            # The circuit is still open, but the next probe is let through
+            with pytest.raises(CircuitOpenError):
+                function()
+
+        assert len(calls) == 6
@@ -1,27 +1,42 @@
 """Test module for verifying split_date_range decorator functionality."""
 
+from contextvars import Context, ContextVar
+import threading
+from time import sleep
 from unittest.mock import patch
 
+import pytest
+
 import entsoe
 from entsoe.query.decorators import (
+    _get_split_pool,
+    _shutdown_split_pool,
     max_days_limit_ctx,
     offset_increment_ctx,
     split_date_range,
 )
+from entsoe.utils.utils import _split_date_range
+
+
+@pytest.fixture(scope="module")
+def mock_query():
+    """Split query function that returns the params of each chunk."""
+
+    @split_date_range
+    def query(params):
+        """Mock query function that returns params for testing."""
+        return [params]
+
+    return query
 
 
 class TestSplitDateRangeDecorator:
     """Test class for split_date_range decorator functionality."""
 
-    def test_split_with_only_period_parameters(self):
+    def test_split_with_only_period_parameters(self, mock_query):
         """Test that the decorator splits based on periodStart/periodEnd
         when no update parameters are present."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         # Test with a 2-year range (730 days)
         params = {
             "periodStart": 202001010000,  # 2020-01-01 00:00
@@ -45,15 +60,10 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_no_split_when_within_limit_period_only(self):
+    def test_no_split_when_within_limit_period_only(self, mock_query):
         """Test that no split occurs when date range is within limit
         using only period parameters."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         # Test with a 6-month range (180 days)
         params = {
             "periodStart": 202001010000,  # 2020-01-01 00:00
@@ -74,15 +84,10 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_split_with_update_parameters(self):
+    def test_split_with_update_parameters(self, mock_query):
         """Test that the decorator splits based on update parameters
         when both period and update parameters are present."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         # Test with period parameters spanning 2 years but update parameters
         # spanning only 6 months - should not split
         params = {
@@ -106,15 +111,10 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_split_update_parameters_exceed_limit(self):
+    def test_split_update_parameters_exceed_limit(self, mock_query):
         """Test that the decorator splits based on update parameters
         when they exceed the limit."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         # Test with update parameters spanning 2 years
         params = {
             "periodStart": 201901010000,  # 2019-01-01 00:00
@@ -142,15 +142,10 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_no_period_parameters(self):
+    def test_no_period_parameters(self, mock_query):
         """Test that the decorator doesn't split when no period parameters
         are present."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         params = {
             "documentType": "A77",
         }
@@ -168,15 +163,21 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_logging_for_update_parameters(self):
+    def test_no_period_parameters_without_context(self, mock_query):
+        """Test that queries without a date range pass through before the max
+        days limit is read from the context."""
+
+        params = {"documentType": "A77"}
+
+        # A fresh context has no max days limit set
+        result = Context().run(mock_query, params)
+
+        assert result == [params]
+
+    def test_logging_for_update_parameters(self, mock_query):
         """Test that appropriate log messages are generated when using
         update parameters and they exceed the limit."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         params = {
             "periodStart": 201901010000,
             "periodEnd": 202301010000,
@@ -204,15 +205,10 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_logging_for_period_parameters(self):
+    def test_logging_for_period_parameters(self, mock_query):
         """Test that appropriate log messages are generated when using
         only period parameters and the range exceeds the limit."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         params = {
             "periodStart": 202001010000,  # 2020-01-01
             "periodEnd": 202201010000,  # 2022-01-01 (2 years - exceeds limit)
@@ -238,14 +234,9 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_split_preserves_other_params(self):
+    def test_split_preserves_other_params(self, mock_query):
         """Test that splitting preserves all other parameters."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         params = {
             "periodStart": 202001010000,
             "periodEnd": 202201010000,
@@ -269,14 +260,9 @@ class TestSplitDateRangeDecorator:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
 
-    def test_recursive_splitting(self):
+    def test_recursive_splitting(self, mock_query):
         """Test that the decorator can split very large ranges into multiple parts."""
 
-        @split_date_range
-        def mock_query(params):
-            """Mock query function that returns params for testing."""
-            return [params]
-
         # Test with a 4-year range (should split into at least 4 parts)
         params = {
             "periodStart": 202001010000,  # 2020-01-01 00:00
@@ -294,3 +280,118 @@ class TestSplitDateRangeDecorator:
         finally:
             max_days_limit_ctx.reset(max_days_token)
             offset_increment_ctx.reset(offset_token)
+
+    def test_chunk_cache_hit(self, mock_query):
+        """Test that repeating a query reuses the cached chunk computation."""
+
+        params = {
+            "periodStart": 201501010000,
+            "periodEnd": 201801010000,
+        }
+
+        entsoe.set_config()
+        max_days_token = max_days_limit_ctx.set(365)
+        try:
+            first = mock_query(params)
+            hits = _split_date_range.cache_info().hits
+            second = mock_query(params)
+
+            assert _split_date_range.cache_info().hits > hits
+            assert second == first
+        finally:
+            max_days_limit_ctx.reset(max_days_token)
+
+    def test_split_propagates_context_to_workers(self):
+        """Test that worker threads see all of the caller's context variables, and
+        that splitting works without offset_increment_ctx being set."""
+        unrelated_ctx: ContextVar[str] = ContextVar("unrelated")
+
+        @split_date_range
+        def mock_query(params):
+            """Mock query function that records the worker's context."""
+            return [(max_days_limit_ctx.get(), unrelated_ctx.get(None))]
+
+        params = {
+            "periodStart": 202001010000,
+            "periodEnd": 202201010000,
+        }
+
+        entsoe.set_config()
+        max_days_token = max_days_limit_ctx.set(365)
+        unrelated_token = unrelated_ctx.set("caller only")
+        try:
+            result = mock_query(params)
+
+            assert len(result) > 1
+            assert all(value == (365, "caller only") for value in result)
+        finally:
+            max_days_limit_ctx.reset(max_days_token)
+            unrelated_ctx.reset(unrelated_token)
+
+    def test_split_preserves_chunk_order(self):
+        """Test that merged results keep chronological order even when earlier
+        chunks finish after later ones."""
+
+        @split_date_range
+        def mock_query(params):
+            """Mock query function where the first chunk is the slowest."""
+            if params["periodStart"] == 202001010000:
+                sleep(0.05)
+            return [params["periodStart"]]
+
+        params = {
+            "periodStart": 202001010000,
+            "periodEnd": 202401010000,
+        }
+
+        entsoe.set_config()
+        max_days_token = max_days_limit_ctx.set(365)
+        try:
+            result = mock_query(params)
+
+            assert result == sorted(result)
+            assert result[0] == 202001010000
+        finally:
+            max_days_limit_ctx.reset(max_days_token)
+
+    def test_split_reuses_thread_pool(self):
+        """Test that repeated split queries run on the same worker threads."""
+        thread_names = set()
+
+        @split_date_range
+        def mock_query(params):
+            """Mock query function that records the worker thread name."""
+            thread_names.add(threading.current_thread().name)
+            return [params["periodStart"]]
+
+        params = {
+            "periodStart": 202001010000,
+            "periodEnd": 202201010000,
+        }
+
+        entsoe.set_config(max_workers=2)
+        max_days_token = max_days_limit_ctx.set(365)
+        try:
+            for _ in range(5):
+                mock_query(params)
+
+            # Five split queries never need more threads than the pool holds
+            assert len(thread_names) <= 2
+            assert _get_split_pool(2) is _get_split_pool(2)
+        finally:
+            max_days_limit_ctx.reset(max_days_token)
+            entsoe.set_config()
+
+    def test_split_pool_replaced_when_max_workers_changes(self):
+        """Test that a new max_workers value replaces the shared pool and shuts
+        the previous one down."""
+        pool = _get_split_pool(2)
+        try:
+            replacement = _get_split_pool(3)
+
+            assert replacement is not pool
+            assert _get_split_pool(3) is replacement
+            with pytest.raises(RuntimeError):
+                pool.submit(int)
+        finally:
+            _shutdown_split_pool()
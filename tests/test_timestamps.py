@@ -0,0 +1,69 @@
+"""Test module for verifying timestamp calculation."""
+
+import pytest
+
+from entsoe.utils import add_timestamps, calculate_timestamp
+
+
+class TestCalculateTimestamp:
+    """Test class for calculate_timestamp functionality."""
+
+    @pytest.mark.parametrize(
+        ("resolution", "position", "expected"),
+        [
+            ("PT60M", 1, "2024-08-19T22:00:00+00:00"),
+            ("PT60M", 2, "2024-08-19T23:00:00+00:00"),
+            ("PT15M", 3, "2024-08-19T22:30:00+00:00"),
+            ("P1D", 2, "2024-08-20T22:00:00+00:00"),
+            ("P1M", 2, "2024-09-19T22:00:00+00:00"),
+            ("P1Y", 2, "2025-08-19T22:00:00+00:00"),
+        ],
+    )
+    def test_start_of_interval(self, resolution, position, expected):
+        """Test timestamps at the start of each interval for several resolutions."""
+        assert (
+            calculate_timestamp("2024-08-19T22:00Z", resolution, position) == expected
+        )
+
+    def test_end_of_interval(self):
+        """Test that interval_type='end' adds one resolution step."""
+        assert (
+            calculate_timestamp("2024-08-19T22:00Z", "PT60M", 1, interval_type="end")
+            == "2024-08-19T23:00:00+00:00"
+        )
+
+    def test_invalid_interval_type_raises(self):
+        """Test that an unknown interval_type raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid interval_type"):
+            calculate_timestamp("2024-08-19T22:00Z", "PT60M", 1, interval_type="mid")
+
+
+class TestAddTimestamps:
+    """Test class for add_timestamps functionality."""
+
+    def test_timestamps_are_added_by_suffix_match(self):
+        """Test that timestamps are calculated from suffix-matched fields."""
+        records = [
+            {
+                "time_series.period.time_interval.start": "2024-08-19T22:00Z",
+                "time_series.period.resolution": "PT60M",
+                "time_series.period.point.position": position,
+                "value": value,
+            }
+            for position, value in [(1, 100), (2, 200)]
+        ]
+
+        result = add_timestamps(records)
+
+        assert [r["timestamp"] for r in result] == [
+            "2024-08-19T22:00:00+00:00",
+            "2024-08-19T23:00:00+00:00",
+        ]
+        # Original records are not modified
+        assert "timestamp" not in records[0]
+
+    def test_records_without_period_fields_are_kept(self):
+        """Test that records missing the period fields are returned unchanged."""
+        records = [{"value": 1}]
+
+        assert add_timestamps(records) == [{"value": 1}]
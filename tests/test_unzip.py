@@ -0,0 +1,102 @@
+"""Test module for verifying unzip decorator functionality."""
+
+import io
+import zipfile
+
+from httpx import Request, Response
+
+from entsoe.query.decorators import unzip
+
+XML_A = '<?xml version="1.0" encoding="UTF-8"?><doc>ä</doc>'.encode("utf-8")
+XML_B = b'<?xml version="1.0" encoding="UTF-8"?><doc>b</doc>'
+
+
+def make_zip(members: dict[str, bytes]) -> bytes:
+    """Build an in-memory ZIP archive from a mapping of file names to bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+def make_response(content: bytes, content_type: str) -> Response:
+    """Build a Response as returned by query_core."""
+    return Response(
+        status_code=200,
+        headers={"Content-Type": content_type},
+        content=content,
+        request=Request("GET", "https://example.com/api"),
+    )
+
+
+class TestUnzipDecorator:
+    """Test class for unzip decorator functionality."""
+
+    def test_zip_response_is_split_into_members(self):
+        """Test that each ZIP member becomes its own Response with the raw bytes."""
+        archive = make_zip({"a.xml": XML_A, "b.xml": XML_B})
+
+        @unzip
+        def fetch(params):
+            return make_response(archive, "application/zip")
+
+        responses = fetch({})
+
+        assert len(responses) == 2
+        assert [r.content for r in responses] == [XML_A, XML_B]
+        for response in responses:
+            assert response.status_code == 200
+            assert response.headers["Content-Type"] == "text/xml; charset=utf-8"
+            assert response.headers["Content-Length"] == str(len(response.content))
+            assert response.request.url == "https://example.com/api"
+
+    def test_zip_directory_entries_are_skipped(self):
+        """Test that directory entries in the archive do not produce responses."""
+        archive = make_zip({"data/": b"", "data/a.xml": XML_A})
+
+        @unzip
+        def fetch(params):
+            return make_response(archive, "application/zip")
+
+        responses = fetch({})
+
+        assert [r.content for r in responses] == [XML_A]
+
+    def test_zip_content_type_with_parameters(self):
+        """Test that ZIP detection tolerates parameters and letter case."""
+        archive = make_zip({"a.xml": XML_A})
+
+        @unzip
+        def fetch(params):
+            return make_response(archive, "Application/ZIP; charset=binary")
+
+        responses = fetch({})
+
+        assert len(responses) == 1
+        assert responses[0].content == XML_A
+
+    def test_zip_detected_by_signature(self):
+        """Test that ZIP archives are unpacked despite a misleading content type."""
+        archive = make_zip({"a.xml": XML_A})
+
+        @unzip
+        def fetch(params):
+            return make_response(archive, "application/octet-stream")
+
+        responses = fetch({})
+
+        assert [r.content for r in responses] == [XML_A]
+
+    def test_non_zip_response_is_passed_through(self):
+        """Test that non-ZIP responses are returned unchanged."""
+        original = make_response(XML_B, "text/xml")
+
+        @unzip
+        def fetch(params):
+            return original
+
+        responses = fetch({})
+
+        assert len(responses) == 1
+        assert responses[0] is original